@@ -11,22 +11,64 @@ Terminology:
 - Session: A game day capture (e.g., 2024_06_13_13_35_17)
 - Event: A single pitch or bat action within a session
 - Each event contains 8 camera MP4s + 1 C3D biomechanics file
+
+Requires boto3 and AWS credentials for AWS_PROFILE.
 """
 
-import subprocess
 import random
 import json
 import sys
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional
 
+import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
+from s3transfer.exceptions import RetriesExceededError, S3DownloadFailedError
+
 # Configuration - use environment variables for sensitive data
 S3_BUCKET = os.environ.get("CAPSTONE_S3_BUCKET", "s3://your-bucket/Data")
 AWS_PROFILE = os.environ.get("AWS_PROFILE", "default")
 LOCAL_DATA_DIR = Path(__file__).parent.parent / "data" / "samples"
 
+# One client for the whole run so LIST calls reuse pooled HTTPS connections.
+# Each in-flight request holds one pooled connection, so the pool is sized to
+# the worker count (needs `ulimit -n` of at least S3_MAX_CONNECTIONS + headroom).
+S3_MAX_CONNECTIONS = 128
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=S3_MAX_CONNECTIONS,
+    retries={"max_attempts": 10, "mode": "adaptive"},
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=10,
+)
+
+# LIST calls are network-bound, so discovery fans out well past the core count
+DISCOVERY_WORKERS = S3_MAX_CONNECTIONS
+SESSIONS_PER_YEAR = 5  # Limit sessions per year for speed
+EVENT_TYPES = ["Pitching", "Batting"]
+
+# LIST output barely changes between runs; reuse it for a day unless refreshed
+LIST_CACHE_PATH = LOCAL_DATA_DIR / ".lscache.json"
+LIST_CACHE_TTL_SEC = 24 * 3600
+
+# Shared across all events so GETs overlap. Any object over 8 MiB is fetched
+# as parallel 8 MiB byte-range GETs, so each MP4 fills several connections.
+# 1 MiB io chunks (default 256 KiB) cut the write() calls per MP4 by 4x.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=16,
+    io_chunksize=1024 * 1024,
+    use_threads=True,
+)
+
 # MLB teams to sample from (major league teams with likely more data)
 MLB_TEAMS = [
     "ARI", "ATH", "BOS", "CHC", "CIN", "CLE", "LAD", "MIA", "MIN",
@@ -34,7 +76,7 @@ MLB_TEAMS = [
 ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Event:
     """Represents a single event (pitch/bat action) within a session."""
     team: str
@@ -45,101 +87,266 @@ class Event:
     full_s3_path: str
 
 
-def run_aws_command(args: list[str]) -> str:
-    """Run an AWS CLI command and return output."""
-    cmd = ["aws", "--profile", AWS_PROFILE] + args
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
-        print(f"Error: {result.stderr}", file=sys.stderr)
-        return ""
-    return result.stdout
+EVENT_FIELDS = [f.name for f in fields(Event)]
+
+
+def events_to_columns(events: list[Event]) -> dict[str, list[str]]:
+    """Store events column-wise: one list per field instead of one dict per event."""
+    return {name: [getattr(e, name) for e in events] for name in EVENT_FIELDS}
+
+
+def events_from_columns(columns: dict[str, list[str]]) -> list[Event]:
+    """Rebuild events from the column-wise manifest layout."""
+    return [Event(*row) for row in zip(*(columns[name] for name in EVENT_FIELDS))]
+
+
+def split_s3_uri(uri: str) -> tuple[str, str]:
+    """Split an s3://bucket/key/prefix URI into (bucket, key_prefix)."""
+    path = uri.removeprefix("s3://")
+    bucket, _, key_prefix = path.partition("/")
+    key_prefix = key_prefix.strip("/")
+    return bucket, f"{key_prefix}/" if key_prefix else ""
+
+
+BUCKET_NAME, KEY_PREFIX = split_s3_uri(S3_BUCKET)
+
+# Service errors and transport failures (timeouts, dropped connections);
+# either one fails a single LIST, not the whole fan-out
+S3_ERRORS = (BotoCoreError, ClientError)
+# A transfer can also exhaust its retries or fail writing the local file
+TRANSFER_ERRORS = (*S3_ERRORS, RetriesExceededError, S3DownloadFailedError, OSError)
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+# {s3_uri: {"fetched_at": epoch_sec, "prefixes": [...]}}
+_list_cache: dict[str, dict] = {}
+_list_cache_lock = threading.Lock()
+
+
+def get_s3_client():
+    """Return the shared S3 client, creating it on first use.
+
+    Safe to call from worker threads: only the first caller builds the
+    session and client.
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                session = boto3.Session(profile_name=AWS_PROFILE)
+                _s3_client = session.client("s3", config=S3_CLIENT_CONFIG)
+    return _s3_client
+
+
+def load_list_cache(path: Path = LIST_CACHE_PATH) -> None:
+    """Populate the LIST cache from disk, dropping expired entries.
+
+    The cache is only an optimisation: an unreadable or malformed file is
+    reported and treated as empty.
+    """
+    if not path.exists():
+        return
+    now = time.time()
+    try:
+        with open(path) as f:
+            entries = json.load(f)
+        fresh = {
+            uri: entry for uri, entry in entries.items()
+            if now - entry["fetched_at"] < LIST_CACHE_TTL_SEC
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+        print(f"Ignoring unreadable list cache {path}: {exc}", file=sys.stderr)
+        return
+    with _list_cache_lock:
+        _list_cache.update(fresh)
+
+
+def save_list_cache(path: Path = LIST_CACHE_PATH) -> None:
+    """Write the LIST cache to disk for the next run.
+
+    Written to a temp file and renamed into place, so an interrupted run
+    leaves the previous cache intact rather than a half-written one.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _list_cache_lock:
+        entries = dict(_list_cache)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(entries, f)
+    os.replace(tmp_path, path)
+
+
+def list_prefixes(prefix: str) -> list[str]:
+    """List the immediate sub-"directories" under a key prefix.
+
+    Results are memoized by S3 URI in the LIST cache, so repeated
+    discoveries only hit S3 for prefixes not seen within the TTL.
+    """
+    uri = f"s3://{BUCKET_NAME}/{prefix}"
+    with _list_cache_lock:
+        entry = _list_cache.get(uri)
+    if entry is not None:
+        return list(entry["prefixes"])
+
+    paginator = get_s3_client().get_paginator("list_objects_v2")
+    names = []
+    for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix=prefix, Delimiter="/"):
+        for common in page.get("CommonPrefixes", []):
+            names.append(common["Prefix"][len(prefix):].rstrip("/"))
+
+    with _list_cache_lock:
+        _list_cache[uri] = {"fetched_at": time.time(), "prefixes": names}
+    return list(names)
+
+
+def list_objects(bucket: str, prefix: str) -> list[tuple[str, int]]:
+    """List every object under a key prefix as (key, size) pairs."""
+    paginator = get_s3_client().get_paginator("list_objects_v2")
+    objects = []
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            objects.append((obj["Key"], obj["Size"]))
+    return objects
 
 
 def list_team_years(team: str) -> list[str]:
     """List available years for a team."""
-    output = run_aws_command(["s3", "ls", f"{S3_BUCKET}/{team}/"])
-    years = []
-    for line in output.strip().split("\n"):
-        if line.strip() and "PRE" in line:
-            year = line.split("PRE")[-1].strip().rstrip("/")
-            if year.isdigit():
-                years.append(year)
-    return years
+    return [year for year in list_prefixes(f"{KEY_PREFIX}{team}/") if year.isdigit()]
 
 
 def list_sessions(team: str, year: str) -> list[str]:
     """List available sessions for a team/year."""
-    output = run_aws_command(["s3", "ls", f"{S3_BUCKET}/{team}/{year}/"])
-    sessions = []
-    for line in output.strip().split("\n"):
-        if line.strip() and "PRE" in line:
-            session = line.split("PRE")[-1].strip().rstrip("/")
-            sessions.append(session)
-    return sessions
+    return list_prefixes(f"{KEY_PREFIX}{team}/{year}/")
 
 
 def list_events(team: str, year: str, session: str, event_type: str) -> list[Event]:
     """List events for a session."""
     path = f"{S3_BUCKET}/{team}/{year}/{session}/{event_type}/"
-    output = run_aws_command(["s3", "ls", path])
+    prefix = f"{KEY_PREFIX}{team}/{year}/{session}/{event_type}/"
     events = []
-    for line in output.strip().split("\n"):
-        if line.strip() and "PRE" in line:
-            event = line.split("PRE")[-1].strip().rstrip("/")
-            events.append(Event(
-                team=team,
-                year=year,
-                session=session,
-                event_type=event_type,
-                event_path=event,
-                full_s3_path=f"{path}{event}/"
-            ))
+    for event in list_prefixes(prefix):
+        events.append(Event(
+            team=team,
+            year=year,
+            session=session,
+            event_type=event_type,
+            event_path=event,
+            full_s3_path=f"{path}{event}/"
+        ))
     return events
 
 
 def discover_all_events(teams: list[str], max_per_team: int = 50) -> list[Event]:
-    """Discover events across all teams."""
-    all_events = []
+    """Discover events across all teams.
+
+    Walks the team/year/session tree level by level, submitting every LIST
+    at a level to a shared thread pool before moving to the next. Teams with
+    more than max_per_team events are randomly subsampled.
+    """
+    get_s3_client()  # create before the workers share it
+
+    with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as pool:
+        year_futures = {pool.submit(list_team_years, team): team for team in teams}
+        team_years = []
+        for future in as_completed(year_futures):
+            team = year_futures[future]
+            try:
+                years = future.result()
+            except S3_ERRORS as exc:
+                print(f"Error listing {KEY_PREFIX}{team}/: {exc}", file=sys.stderr)
+                continue
+            team_years.extend((team, year) for year in years)
+
+        session_futures = {
+            pool.submit(list_sessions, team, year): (team, year)
+            for team, year in team_years
+        }
+        team_sessions = []
+        for future in as_completed(session_futures):
+            team, year = session_futures[future]
+            try:
+                sessions = future.result()[:SESSIONS_PER_YEAR]
+            except S3_ERRORS as exc:
+                print(f"Error listing {KEY_PREFIX}{team}/{year}/: {exc}", file=sys.stderr)
+                continue
+            team_sessions.extend((team, year, session) for session in sessions)
+
+        event_futures = {
+            pool.submit(list_events, team, year, session, event_type): (team, year, session, event_type)
+            for team, year, session in team_sessions
+            for event_type in EVENT_TYPES
+        }
+        events_by_team: dict[str, list[Event]] = {team: [] for team in teams}
+        for future in as_completed(event_futures):
+            try:
+                events = future.result()
+            except S3_ERRORS as exc:
+                team, year, session, event_type = event_futures[future]
+                print(f"Error listing {KEY_PREFIX}{team}/{year}/{session}/{event_type}/: {exc}",
+                      file=sys.stderr)
+                continue
+            for event in events:
+                events_by_team[event.team].append(event)
 
+    all_events = []
     for team in teams:
-        print(f"Scanning {team}...", end=" ", flush=True)
-        team_events = []
-
-        years = list_team_years(team)
-        for year in years:
-            sessions = list_sessions(team, year)
-            for session in sessions[:5]:  # Limit sessions per year for speed
-                for event_type in ["Pitching", "Batting"]:
-                    events = list_events(team, year, session, event_type)
-                    team_events.extend(events)
-
-                    if len(team_events) >= max_per_team:
-                        break
-                if len(team_events) >= max_per_team:
-                    break
-            if len(team_events) >= max_per_team:
-                break
-
-        print(f"found {len(team_events)} events")
-        all_events.extend(team_events[:max_per_team])
+        # Completion order is nondeterministic; sort so --seed stays reproducible
+        team_events = sorted(events_by_team[team], key=lambda e: e.full_s3_path)
+        print(f"Scanned {team}: found {len(team_events)} events")
+        if len(team_events) > max_per_team:
+            team_events = random.sample(team_events, max_per_team)
+        all_events.extend(team_events)
 
     return all_events
 
 
-def download_event(event: Event, dest_dir: Path) -> bool:
-    """Download a single event to local directory."""
-    # Create destination path maintaining structure
-    dest_path = dest_dir / event.team / event.year / event.session / event.event_type / event.event_path
-    dest_path.mkdir(parents=True, exist_ok=True)
-
-    print(f"  Downloading {event.event_path}...")
-    result = run_aws_command([
-        "s3", "sync",
-        event.full_s3_path,
-        str(dest_path),
-        "--quiet"
-    ])
-    return True
+def download_events(events: list[Event], dest_dir: Path) -> int:
+    """Download all events through one TransferManager; return the failure count.
+
+    Event folders are listed concurrently, then every object of every event
+    is queued before waiting, so the manager keeps many GETs in flight at
+    once. Files already present locally with the same size are skipped,
+    matching the old `aws s3 sync` behaviour.
+    """
+    locations = [split_s3_uri(event.full_s3_path) for event in events]
+    failed_listings: list[str] = []
+
+    def list_event_objects(location: tuple[str, str]) -> list[tuple[str, int]]:
+        # Best effort, as before: a failed listing skips that event only
+        bucket, prefix = location
+        try:
+            return list_objects(bucket, prefix)
+        except S3_ERRORS as exc:
+            print(f"Error listing s3://{bucket}/{prefix}: {exc}", file=sys.stderr)
+            failed_listings.append(prefix)
+            return []
+
+    get_s3_client()  # a manifest run skips discovery, so create it here
+    with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as pool:
+        listings = list(pool.map(list_event_objects, locations))
+
+    futures = []
+    with create_transfer_manager(get_s3_client(), TRANSFER_CONFIG) as manager:
+        for i, (event, (bucket, prefix), objects) in enumerate(zip(events, locations, listings), 1):
+            print(f"[{i}/{len(events)}] {event.team}/{event.event_path}")
+            # Create destination path maintaining structure
+            dest_path = dest_dir / event.team / event.year / event.session / event.event_type / event.event_path
+            for key, size in objects:
+                local_path = dest_path / key[len(prefix):]
+                if local_path.exists() and local_path.stat().st_size == size:
+                    continue
+                local_path.parent.mkdir(parents=True, exist_ok=True)
+                futures.append((key, manager.download(bucket, key, str(local_path))))
+
+    failed = len(failed_listings)
+    for key, future in futures:
+        try:
+            future.result()
+        except TRANSFER_ERRORS as exc:
+            print(f"Error downloading {key}: {exc}", file=sys.stderr)
+            failed += 1
+    return failed
 
 
 def main():
@@ -149,6 +356,7 @@ def main():
     parser.add_argument("--discover-only", action="store_true", help="Only discover, don't download")
     parser.add_argument("--manifest", type=str, help="Save/load manifest file")
     parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducibility")
+    parser.add_argument("--refresh-cache", action="store_true", help="Ignore cached S3 listings")
     args = parser.parse_args()
 
     random.seed(args.seed)
@@ -160,24 +368,30 @@ def main():
         print(f"Loading existing manifest from {manifest_path}")
         with open(manifest_path) as f:
             data = json.load(f)
-            events = [Event(**r) for r in data["events"]]
+        if isinstance(data["events"], dict):
+            events = events_from_columns(data["events"])
+        else:  # manifests written before the column-wise layout
+            events = [Event(*(r[name] for name in EVENT_FIELDS)) for r in data["events"]]
     else:
+        if not args.refresh_cache:
+            load_list_cache()
         print(f"Discovering events across {len(MLB_TEAMS)} teams...")
         all_events = discover_all_events(MLB_TEAMS)
+        save_list_cache()
         print(f"\nTotal events found: {len(all_events)}")
 
         # Randomly select N events
         events = random.sample(all_events, min(args.count, len(all_events)))
         print(f"Selected {len(events)} random events")
 
-        # Save manifest
+        # Save manifest (compact separators: no whitespace to write or re-parse)
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
         with open(manifest_path, "w") as f:
             json.dump({
                 "count": len(events),
                 "seed": args.seed,
-                "events": [vars(r) for r in events]
-            }, f, indent=2)
+                "events": events_to_columns(events)
+            }, f, separators=(",", ":"))
         print(f"Manifest saved to {manifest_path}")
 
     if args.discover_only:
@@ -186,9 +400,9 @@ def main():
 
     # Download events
     print(f"\nDownloading {len(events)} events to {LOCAL_DATA_DIR}...")
-    for i, event in enumerate(events, 1):
-        print(f"[{i}/{len(events)}] {event.team}/{event.event_path}")
-        download_event(event, LOCAL_DATA_DIR)
+    failed = download_events(events, LOCAL_DATA_DIR)
+    if failed:
+        print(f"{failed} files failed to download", file=sys.stderr)
 
     print("\nDone!")
 
@@ -1,9 +1,14 @@
 """Plotly chart builders for the cloud acceleration dashboard."""
 
-from typing import Dict, List, Optional, Tuple
+import pickle
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
+import numpy as np
 import plotly.graph_objects as go
+import streamlit as st
 
+from data.loaders import INSTANCE_PRICING, PRICING_LABELS
 from data.schemas import BatchResult, EventAssignment, ParetoPoint
 
 
@@ -27,6 +32,48 @@ INSTANCE_GPU_LABELS = {
     "p3.2xlarge":  "V100",
 }
 
+# (instance name, pricing tier) -> (short GPU label, pricing label), built once
+CONFIG_LABELS: Mapping[Tuple[str, str], Tuple[str, str]] = MappingProxyType({
+    (inst.name, pricing): (INSTANCE_GPU_LABELS.get(inst.name, inst.name), PRICING_LABELS[pricing])
+    for inst, pricing in INSTANCE_PRICING
+})
+
+# Figures for unchanged inputs are served from cache across reruns
+FIGURE_CACHE_ENTRIES = 32
+
+# Small-int codes for bincount; anything unrecognized lands in bucket 2
+_LOCATION_INDEX = {"on_prem": 0, "cloud": 1}
+_EVENT_TYPE_INDEX = {"Batting": 0, "Pitching": 1}
+
+
+def _points_key(points: object) -> bytes:
+    """Cache key for large point collections: one pickle instead of hashing each point.
+
+    st.cache_data hashes a list of ParetoPoints element by element, which for
+    a multi-instance sweep costs about as much as building the figure.
+    """
+    return pickle.dumps(points, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _point_arrays(points: List[ParetoPoint]) -> Dict[str, np.ndarray]:
+    """Pull ParetoPoint fields into parallel arrays in a single pass."""
+    n = len(points)
+    ids = np.empty(n, dtype=object)
+    cost = np.empty(n, dtype=np.float64)
+    hours = np.empty(n, dtype=np.float64)
+    containers = np.empty(n, dtype=np.int64)
+    optimal = np.empty(n, dtype=bool)
+    for i, p in enumerate(points):
+        ids[i] = p.config_id
+        cost[i] = p.cost
+        hours[i] = p.time / 3600
+        containers[i] = p.cloud_containers
+        optimal[i] = p.is_pareto_optimal
+    return {
+        "config_id": ids, "cost": cost, "hours": hours,
+        "containers": containers, "optimal": optimal,
+    }
+
 
 def create_pareto_chart(
     points: List[ParetoPoint],
@@ -38,13 +85,23 @@ def create_pareto_chart(
 
     x_mode: "containers" for Cloud Containers Added, "cost" for Additional Cloud Cost ($).
     """
-    pareto = [p for p in points if p.is_pareto_optimal]
-    non_pareto = [p for p in points if not p.is_pareto_optimal]
+    return _pareto_figure(_points_key((points, optimal)), title, x_mode, points, optimal)
 
-    def _x(p: ParetoPoint) -> float:
-        return p.cloud_containers if x_mode == "containers" else p.cost
 
-    def _sort_key(p: ParetoPoint) -> float:
+@st.cache_data(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _pareto_figure(
+    key: bytes,
+    title: str,
+    x_mode: str,
+    _points: List[ParetoPoint],
+    _optimal: Optional[ParetoPoint],
+) -> go.Figure:
+    points, optimal = _points, _optimal
+    cols = _point_arrays(points)
+    x_all = cols["containers"] if x_mode == "containers" else cols["cost"]
+    opt = cols["optimal"]
+
+    def _x(p: ParetoPoint) -> float:
         return p.cloud_containers if x_mode == "containers" else p.cost
 
     x_label = "Cloud Containers Added" if x_mode == "containers" else "Additional Cloud Cost ($)"
@@ -52,10 +109,11 @@ def create_pareto_chart(
     fig = go.Figure()
 
     # Sub-optimal points
-    if non_pareto:
+    non_pareto = np.flatnonzero(~opt)
+    if non_pareto.size:
         fig.add_trace(go.Scatter(
-            x=[_x(p) for p in non_pareto],
-            y=[p.time / 3600 for p in non_pareto],
+            x=x_all[non_pareto],
+            y=cols["hours"][non_pareto],
             mode="markers",
             name="Sub-optimal",
             marker=dict(size=7, opacity=0.35, color="gray"),
@@ -65,16 +123,21 @@ def create_pareto_chart(
                 "Cloud cost: $%{customdata[1]:.2f}<br>"
                 "Turnaround: %{y:.1f} hrs<extra></extra>"
             ),
-            customdata=[[p.config_id, p.cost, p.cloud_containers] for p in non_pareto],
+            customdata=np.column_stack((
+                cols["config_id"][non_pareto], cols["cost"][non_pareto], cols["containers"][non_pareto],
+            )),
         ))
 
     # Pareto frontier line + points
-    if pareto:
-        pareto_sorted = sorted(pareto, key=_sort_key)
+    pareto = np.flatnonzero(opt)
+    if pareto.size:
+        pareto_sorted = pareto[np.argsort(x_all[pareto], kind="stable")]
+        x_sorted = x_all[pareto_sorted]
+        y_sorted = cols["hours"][pareto_sorted]
 
         fig.add_trace(go.Scatter(
-            x=[_x(p) for p in pareto_sorted],
-            y=[p.time / 3600 for p in pareto_sorted],
+            x=x_sorted,
+            y=y_sorted,
             mode="lines",
             name="Pareto Frontier",
             line=dict(color="#3498db", width=2, dash="dash"),
@@ -82,8 +145,8 @@ def create_pareto_chart(
         ))
 
         fig.add_trace(go.Scatter(
-            x=[_x(p) for p in pareto_sorted],
-            y=[p.time / 3600 for p in pareto_sorted],
+            x=x_sorted,
+            y=y_sorted,
             mode="markers",
             name="Pareto-Optimal",
             marker=dict(size=10, color="#3498db", line=dict(width=1, color="white")),
@@ -93,7 +156,9 @@ def create_pareto_chart(
                 "Cloud cost: $%{customdata[1]:.2f}<br>"
                 "Turnaround: %{y:.1f} hrs<extra></extra>"
             ),
-            customdata=[[p.config_id, p.cost, p.cloud_containers] for p in pareto_sorted],
+            customdata=np.column_stack((
+                cols["config_id"][pareto_sorted], cols["cost"][pareto_sorted], cols["containers"][pareto_sorted],
+            )),
         ))
 
     # Highlight recommended point
@@ -145,26 +210,32 @@ def create_multi_site_chart(
         site_frontiers: {label: (points, tier)} where tier is used for color.
         x_mode: "containers" or "cost" for x-axis.
     """
-    fig = go.Figure()
+    return _multi_site_figure(_points_key(site_frontiers), x_mode, site_frontiers)
 
-    def _x(p: ParetoPoint) -> float:
-        return p.cloud_containers if x_mode == "containers" else p.cost
 
-    def _sort_key(p: ParetoPoint) -> float:
-        return p.cloud_containers if x_mode == "containers" else p.cost
+@st.cache_data(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _multi_site_figure(
+    key: bytes,
+    x_mode: str,
+    _site_frontiers: Dict[str, Tuple[List[ParetoPoint], str]],
+) -> go.Figure:
+    site_frontiers = _site_frontiers
+    fig = go.Figure()
 
     x_label = "Cloud Containers Added" if x_mode == "containers" else "Additional Cloud Cost ($)"
 
     for i, (label, (points, tier)) in enumerate(site_frontiers.items()):
-        optimal = [p for p in points if p.is_pareto_optimal]
-        if not optimal:
+        cols = _point_arrays(points)
+        x_all = cols["containers"] if x_mode == "containers" else cols["cost"]
+        optimal = np.flatnonzero(cols["optimal"])
+        if not optimal.size:
             continue
-        optimal_sorted = sorted(optimal, key=_sort_key)
+        optimal_sorted = optimal[np.argsort(x_all[optimal], kind="stable")]
         color = SITE_COLORS[i % len(SITE_COLORS)]
 
         fig.add_trace(go.Scatter(
-            x=[_x(p) for p in optimal_sorted],
-            y=[p.time / 3600 for p in optimal_sorted],
+            x=x_all[optimal_sorted],
+            y=cols["hours"][optimal_sorted],
             mode="lines+markers",
             name=label,
             line=dict(color=color, width=2),
@@ -176,7 +247,9 @@ def create_multi_site_chart(
                 "Cloud cost: $%{customdata[2]:.2f}<br>"
                 "Turnaround: %{y:.1f} hrs<extra></extra>"
             ),
-            customdata=[[p.config_id, p.cloud_containers, p.cost] for p in optimal_sorted],
+            customdata=np.column_stack((
+                cols["config_id"][optimal_sorted], cols["containers"][optimal_sorted], cols["cost"][optimal_sorted],
+            )),
         ))
 
     fig.update_layout(
@@ -199,20 +272,25 @@ def create_assignment_bar(result: BatchResult) -> go.Figure:
                            xref="paper", yref="paper", x=0.5, y=0.5, showarrow=False)
         return fig
 
-    # Group load by processor
-    proc_loads: Dict[int, float] = {}
-    proc_type: Dict[int, str] = {}
-    for a in result.assignments:
-        proc_loads[a.processor_id] = proc_loads.get(a.processor_id, 0) + a.effective_time_sec
-        proc_type[a.processor_id] = a.assigned_to
+    # Group load by processor: np.unique sorts ids, bincount sums per id
+    assignments = result.assignments
+    n = len(assignments)
+    proc_ids = np.fromiter((a.processor_id for a in assignments), dtype=np.int64, count=n)
+    seconds = np.fromiter((a.effective_time_sec for a in assignments), dtype=np.float64, count=n)
+    location = np.fromiter(
+        (_LOCATION_INDEX.get(a.assigned_to, 2) for a in assignments), dtype=np.intp, count=n
+    )
+    _, first, inverse = np.unique(proc_ids, return_index=True, return_inverse=True)
+    hours = np.bincount(inverse, weights=seconds) / 3600
+    proc_location = location[first]
 
     # Separate on-prem and cloud
-    on_prem_ids = sorted(pid for pid, t in proc_type.items() if t == "on_prem")
-    cloud_ids = sorted(pid for pid, t in proc_type.items() if t == "cloud")
+    on_prem_hours = hours[proc_location == 0]
+    cloud_hours = hours[proc_location == 1]
 
-    labels = [f"GPU {i}" for i in range(len(on_prem_ids))] + [f"Cloud {i}" for i in range(len(cloud_ids))]
-    values = [proc_loads[pid] / 3600 for pid in on_prem_ids] + [proc_loads[pid] / 3600 for pid in cloud_ids]
-    colors = ["#2ecc71"] * len(on_prem_ids) + ["#3498db"] * len(cloud_ids)
+    labels = [f"GPU {i}" for i in range(len(on_prem_hours))] + [f"Cloud {i}" for i in range(len(cloud_hours))]
+    values = np.concatenate((on_prem_hours, cloud_hours))
+    colors = ["#2ecc71"] * len(on_prem_hours) + ["#3498db"] * len(cloud_hours)
 
     fig = go.Figure(go.Bar(
         x=labels,
@@ -233,21 +311,25 @@ def create_assignment_bar(result: BatchResult) -> go.Figure:
 
 def create_event_type_breakdown(assignments: List[EventAssignment]) -> go.Figure:
     """Show how event types (Batting/Pitching) are distributed across on-prem vs cloud."""
-    categories = {}
-    for a in assignments:
-        key = (a.assigned_to, a.event_type)
-        categories[key] = categories.get(key, 0) + 1
-
-    on_prem_batting = categories.get(("on_prem", "Batting"), 0)
-    on_prem_pitching = categories.get(("on_prem", "Pitching"), 0)
-    cloud_batting = categories.get(("cloud", "Batting"), 0)
-    cloud_pitching = categories.get(("cloud", "Pitching"), 0)
+    n = len(assignments)
+    location = np.fromiter(
+        (_LOCATION_INDEX.get(a.assigned_to, 2) for a in assignments), dtype=np.uint8, count=n
+    )
+    event_type = np.fromiter(
+        (_EVENT_TYPE_INDEX.get(a.event_type, 2) for a in assignments), dtype=np.uint8, count=n
+    )
+    known = (location < 2) & (event_type < 2)
+    # 2-bit key: bit 1 = cloud, bit 0 = pitching
+    codes = (location[known] << 1) | event_type[known]
+    counts = np.bincount(codes, minlength=4).tolist()
+    batting = [counts[0], counts[2]]   # [on-prem, cloud]
+    pitching = [counts[1], counts[3]]
 
     fig = go.Figure(data=[
         go.Bar(name="Batting", x=["On-Prem", "Cloud"],
-               y=[on_prem_batting, cloud_batting], marker_color="#2ecc71"),
+               y=batting, marker_color="#2ecc71"),
         go.Bar(name="Pitching", x=["On-Prem", "Cloud"],
-               y=[on_prem_pitching, cloud_pitching], marker_color="#3498db"),
+               y=pitching, marker_color="#3498db"),
     ])
 
     fig.update_layout(
@@ -263,8 +345,13 @@ def create_event_type_breakdown(assignments: List[EventAssignment]) -> go.Figure
 
 def create_processing_time_histogram(assignments: List[EventAssignment]) -> go.Figure:
     """Histogram of on-prem measured processing times, colored by assignment."""
-    on_prem = [a.processing_time_sec / 60 for a in assignments if a.assigned_to == "on_prem"]
-    cloud = [a.processing_time_sec / 60 for a in assignments if a.assigned_to == "cloud"]
+    n = len(assignments)
+    minutes = np.fromiter((a.processing_time_sec for a in assignments), dtype=np.float64, count=n) / 60
+    location = np.fromiter(
+        (_LOCATION_INDEX.get(a.assigned_to, 2) for a in assignments), dtype=np.intp, count=n
+    )
+    on_prem = minutes[location == 0]
+    cloud = minutes[location == 1]
 
     fig = go.Figure()
     fig.add_trace(go.Histogram(
@@ -288,19 +375,31 @@ def create_sensitivity_chart(
     param_name: str = "Parameter",
 ) -> go.Figure:
     """Overlay Pareto frontiers for different parameter values."""
+    return _sensitivity_figure(_points_key(frontiers), param_name, frontiers)
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _sensitivity_figure(
+    key: bytes,
+    param_name: str,
+    _frontiers: Dict[str, List[ParetoPoint]],
+) -> go.Figure:
+    frontiers = _frontiers
     fig = go.Figure()
 
     colors = ["#e74c3c", "#f39c12", "#3498db", "#2ecc71", "#9b59b6", "#1abc9c"]
 
     for i, (label, points) in enumerate(frontiers.items()):
-        optimal = sorted([p for p in points if p.is_pareto_optimal], key=lambda p: p.cost)
-        if not optimal:
+        cols = _point_arrays(points)
+        optimal = np.flatnonzero(cols["optimal"])
+        if not optimal.size:
             continue
+        optimal = optimal[np.argsort(cols["cost"][optimal], kind="stable")]
         color = colors[i % len(colors)]
 
         fig.add_trace(go.Scatter(
-            x=[p.cost for p in optimal],
-            y=[p.time / 3600 for p in optimal],
+            x=cols["cost"][optimal],
+            y=cols["hours"][optimal],
             mode="lines+markers",
             name=label,
             line=dict(color=color, width=2),
@@ -334,6 +433,19 @@ def create_multi_instance_pareto_chart(
             "ondemand": "On-Demand", "spot": "Spot",
             "1yr_ri": "1yr RI", "3yr_ri": "3yr RI",
         }
+    # Read-only mappings (e.g. loaders.PRICING_LABELS) are not hashable by st.cache_data
+    return _multi_instance_figure(_points_key(points), title, dict(pricing_labels), x_mode, points)
+
+
+@st.cache_data(max_entries=FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _multi_instance_figure(
+    key: bytes,
+    title: str,
+    pricing_labels: Dict[str, str],
+    x_mode: str,
+    _points: List[ParetoPoint],
+) -> go.Figure:
+    points = _points
 
     def _x(p: ParetoPoint) -> float:
         return p.cloud_containers if x_mode == "containers" else p.cost
@@ -371,12 +483,15 @@ def create_multi_instance_pareto_chart(
             ],
         ))
 
-    # Frontier line connecting all optimal points
+    # Frontier line connecting all optimal points, ordered on arrays rather
+    # than through a per-point sort key
     if frontier:
-        frontier_sorted = sorted(frontier, key=lambda p: _x(p))
+        cols = _point_arrays(frontier)
+        x_line = cols["containers"] if x_mode == "containers" else cols["cost"]
+        order = np.argsort(x_line, kind="stable")
         fig.add_trace(go.Scatter(
-            x=[_x(p) for p in frontier_sorted],
-            y=[p.time / 3600 for p in frontier_sorted],
+            x=x_line[order],
+            y=cols["hours"][order],
             mode="lines",
             name="Pareto Frontier",
             line=dict(color="rgba(52, 152, 219, 0.5)", width=2, dash="dash"),
@@ -387,8 +502,8 @@ def create_multi_instance_pareto_chart(
     # Frontier points grouped by instance type
     instance_groups: Dict[str, List[ParetoPoint]] = {}
     for p in frontier:
-        key = p.instance_type or "unknown"
-        instance_groups.setdefault(key, []).append(p)
+        instance = p.instance_type or "unknown"
+        instance_groups.setdefault(instance, []).append(p)
 
     for inst_name, inst_points in instance_groups.items():
         sorted_pts = sorted(inst_points, key=lambda p: _x(p))
@@ -3,8 +3,10 @@
 from .loaders import (
     PRESET_SITE_PROFILES,
     SITE_GPU_COUNTS,
+    iter_onprem_results,
     load_event_ledger,
     load_onprem_results,
+    load_onprem_results_df,
     sample_game_batch,
 )
 from .schemas import (
@@ -28,6 +30,8 @@ __all__ = [
     "SITE_GPU_COUNTS",
     "PRESET_SITE_PROFILES",
     "load_onprem_results",
+    "load_onprem_results_df",
+    "iter_onprem_results",
     "load_event_ledger",
     "sample_game_batch",
 ]
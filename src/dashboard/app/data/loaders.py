@@ -1,53 +1,83 @@
 """Load real on-prem processing results and site profiles."""
 
+from __future__ import annotations
+
 import csv
-import random
+import dataclasses
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
 
 from .schemas import Event, InstanceType, SiteProfile
 
+# pandas is imported where CSVs are parsed, so importing the schemas or the
+# scheduler (which pulls in this package) does not pay for it
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 # --- GPU Instance Types with Pricing ---
 # On-demand and RI rates: aws-pricing.com (verified Feb 2026, us-east-1)
 # Spot rates: instances.vantage.sh / aws-pricing.com (fluctuates; representative values)
 # Ratios: 25-event stratified pilot benchmarks (Feb 2026)
 # p3.2xlarge: reserved instances not available on AWS
-INSTANCE_TYPES: List[InstanceType] = [
+INSTANCE_TYPES: Tuple[InstanceType, ...] = (
     InstanceType(name="g4dn.xlarge", gpu="Tesla T4",    rate_ondemand=0.526, rate_spot=0.208, rate_1yr_ri=0.309, rate_3yr_ri=0.198, ratio=2.18,  has_real_data=True),
     InstanceType(name="g5.xlarge",   gpu="NVIDIA A10G",  rate_ondemand=1.006, rate_spot=0.387, rate_1yr_ri=0.592, rate_3yr_ri=0.378, ratio=1.167, has_real_data=True),
     InstanceType(name="g6.xlarge",   gpu="NVIDIA L4",    rate_ondemand=0.805, rate_spot=0.344, rate_1yr_ri=0.489, rate_3yr_ri=0.321, ratio=1.278, has_real_data=True),
     InstanceType(name="p3.2xlarge",  gpu="Tesla V100",   rate_ondemand=3.060, rate_spot=0.330, rate_1yr_ri=None,  rate_3yr_ri=None,  ratio=1.368, has_real_data=True),
-]
+)
 
-INSTANCE_TYPE_MAP: Dict[str, InstanceType] = {it.name: it for it in INSTANCE_TYPES}
+# Read-only views: these tables are shared by every page and must not mutate
+INSTANCE_TYPE_MAP: Mapping[str, InstanceType] = MappingProxyType(
+    {it.name: it for it in INSTANCE_TYPES}
+)
 
-PRICING_MODES: List[str] = ["ondemand", "spot", "1yr_ri", "3yr_ri"]
-PRICING_LABELS: Dict[str, str] = {
+PRICING_MODES: Tuple[str, ...] = ("ondemand", "spot", "1yr_ri", "3yr_ri")
+PRICING_LABELS: Mapping[str, str] = MappingProxyType({
     "ondemand": "On-Demand",
     "spot": "Spot",
     "1yr_ri": "1yr RI",
     "3yr_ri": "3yr RI",
-}
+})
+
+# Every purchasable (instance, pricing tier) pair, in catalogue order
+INSTANCE_PRICING: Tuple[Tuple[InstanceType, str], ...] = tuple(
+    (it, pricing) for it in INSTANCE_TYPES for pricing in it.available_pricing()
+)
+
+# Sidebar display label -> catalogue entry, shared by every page's selectboxes
+INSTANCE_OPTIONS: Mapping[str, InstanceType] = MappingProxyType(
+    {f"{it.gpu} ({it.name})": it for it in INSTANCE_TYPES}
+)
 
 # Real GPU counts from production controllers spreadsheet (Feb 2026)
-SITE_GPU_COUNTS: Dict[str, int] = {
+SITE_GPU_COUNTS: Mapping[str, int] = MappingProxyType({
     "NYY": 93, "TEX": 46, "SEA": 36, "CIN": 29, "MIL": 26,
     "PHI": 23, "OAK": 21, "ARZ": 20, "NYM": 18, "CHC": 17,
     "MIA": 12, "BOS": 5, "MIN": 3, "CLE": 0, "LAD": 0, "TBR": 0,
-}
+})
 
 # Representative presets across three tiers
-PRESET_SITE_PROFILES: List[SiteProfile] = [
+PRESET_SITE_PROFILES: Tuple[SiteProfile, ...] = (
     SiteProfile(name="Minnesota Twins", venue_code="MIN", available_gpus=3, tier="gpu_poor"),
     SiteProfile(name="Boston Red Sox", venue_code="BOS", available_gpus=5, tier="gpu_poor"),
     SiteProfile(name="Miami Marlins", venue_code="MIA", available_gpus=12, tier="gpu_moderate"),
     SiteProfile(name="Arizona Diamondbacks", venue_code="ARZ", available_gpus=20, tier="gpu_moderate"),
     SiteProfile(name="Seattle Mariners", venue_code="SEA", available_gpus=36, tier="gpu_rich"),
     SiteProfile(name="New York Yankees", venue_code="NYY", available_gpus=93, tier="gpu_rich"),
-]
+)
+
+SITE_OPTIONS: Mapping[str, SiteProfile] = MappingProxyType(
+    {s.name: s for s in PRESET_SITE_PROFILES}
+)
 
 
+# Default data paths are resolved once per process (restart to pick up new files)
+@functools.lru_cache(maxsize=1)
 def _project_root() -> Path:
     """Resolve project root relative to this file.
 
@@ -56,6 +86,7 @@ def _project_root() -> Path:
     return Path(__file__).resolve().parent.parent.parent.parent.parent
 
 
+@functools.lru_cache(maxsize=1)
 def _default_csv_path() -> Path:
     """Default to the curated 200-event dataset with matched cloud/on-prem times."""
     combined = _project_root() / "docs" / "data" / "combined_results_final.csv"
@@ -64,20 +95,54 @@ def _default_csv_path() -> Path:
     return _project_root() / "docs" / "data" / "onprem_results_clean.csv"
 
 
+@functools.lru_cache(maxsize=1)
 def _default_ledger_path() -> Optional[Path]:
     """Return ledger path if the file exists, else None."""
     path = _project_root() / "docs" / "data" / "event_ledger_v3.csv"
     return path if path.exists() else None
 
 
-def load_event_ledger(csv_path: str) -> Dict[str, dict]:
-    """Load event ledger CSV, keyed by event_name."""
-    ledger: Dict[str, dict] = {}
+def _mtime_ns(path: Optional[Path]) -> int:
+    """File modification time, used to invalidate cached loads."""
+    return path.stat().st_mtime_ns if path is not None else 0
+
+
+# Ledger fields joined onto Event; the rest of the ledger is never read
+LEDGER_JOIN_COLUMNS = ("session", "fps", "s3_path")
+
+
+def load_event_ledger(
+    csv_path: str,
+    columns: Optional[Tuple[str, ...]] = None,
+) -> Mapping[str, Mapping[str, str]]:
+    """Load event ledger CSV, keyed by event_name.
+
+    If columns is given, each row keeps only those fields (when present).
+    Parsed ledgers are cached per (path, mtime, columns) and shared as
+    read-only views, so callers cannot mutate the cached rows.
+    """
+    path = Path(csv_path).resolve()
+    return _load_event_ledger_cached(str(path), _mtime_ns(path), columns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_event_ledger_cached(
+    csv_path: str,
+    mtime_ns: int,
+    columns: Optional[Tuple[str, ...]],
+) -> Mapping[str, Mapping[str, str]]:
+    ledger: Dict[str, Mapping[str, str]] = {}
     with open(csv_path, newline="") as f:
         reader = csv.DictReader(f)
-        for row in reader:
-            ledger[row["event_name"]] = dict(row)
-    return ledger
+        if columns is None:
+            # DictReader already yields a fresh dict per row; no copy needed
+            for row in reader:
+                ledger[row["event_name"]] = MappingProxyType(row)
+        else:
+            keep = [c for c in columns if c in (reader.fieldnames or ())]
+            for row in reader:
+                ledger[row["event_name"]] = MappingProxyType({c: row[c] for c in keep})
+    return MappingProxyType(ledger)
 
 
 def load_onprem_results(
@@ -97,65 +162,203 @@ def load_onprem_results(
 
     When enrich=True (default), automatically joins the event ledger if
     found at the standard location (docs/data/event_ledger_v3.csv).
+
+    Results are cached per (CSV path, ledger path, their mtimes, filters),
+    so repeated calls skip the parse until either file changes.
     """
-    path = Path(csv_path) if csv_path else _default_csv_path()
+    path, lpath = _resolve_result_paths(csv_path, enrich, ledger_path)
+    return list(_load_onprem_results_cached(
+        str(path),
+        _mtime_ns(path),
+        min_processing_time,
+        require_valid_c3d,
+        str(lpath) if lpath is not None else None,
+        _mtime_ns(lpath),
+    ))
+
+
+def load_onprem_results_df(
+    csv_path: Optional[str] = None,
+    min_processing_time: float = 60.0,
+    require_valid_c3d: bool = True,
+    enrich: bool = True,
+    ledger_path: Optional[str] = None,
+) -> pd.DataFrame:
+    """Column-oriented view of load_onprem_results, one row per Event.
 
-    # Pre-load ledger for enrichment
-    ledger: Dict[str, dict] = {}
+    For count/mean style aggregates over the event set; the scheduler still
+    takes List[Event]. event_type and venue are categoricals and missing fps
+    is NaN.
+    """
+    import pandas as pd
+
+    events = load_onprem_results(
+        csv_path, min_processing_time, require_valid_c3d, enrich, ledger_path
+    )
+    df = pd.DataFrame({
+        f.name: [getattr(e, f.name) for e in events] for f in dataclasses.fields(Event)
+    })
+    df["fps"] = df["fps"].astype(float)
+    return df.astype({"event_type": "category", "venue": "category"})
+
+
+def iter_onprem_results(
+    csv_path: Optional[str] = None,
+    min_processing_time: float = 60.0,
+    require_valid_c3d: bool = True,
+    enrich: bool = True,
+    ledger_path: Optional[str] = None,
+) -> Iterator[Event]:
+    """Yield the same events as load_onprem_results, one at a time.
+
+    Uncached: each Event is built only when the consumer asks for it, so
+    islice/filter pipelines stop early without materializing the full list.
+    """
+    path, lpath = _resolve_result_paths(csv_path, enrich, ledger_path)
+    return _iter_onprem_events(
+        str(path),
+        min_processing_time,
+        require_valid_c3d,
+        str(lpath) if lpath is not None else None,
+    )
+
+
+def _resolve_result_paths(
+    csv_path: Optional[str],
+    enrich: bool,
+    ledger_path: Optional[str],
+) -> Tuple[Path, Optional[Path]]:
+    """Absolute results CSV path and, when enriching, the ledger path (if any)."""
+    path = (Path(csv_path) if csv_path else _default_csv_path()).resolve()
+    lpath: Optional[Path] = None
     if enrich:
         lpath = Path(ledger_path) if ledger_path else _default_ledger_path()
-        if lpath is not None:
-            ledger = load_event_ledger(str(lpath))
-
-    events: List[Event] = []
-    with open(path, newline="") as f:
-        reader = csv.DictReader(f)
-        fieldnames = reader.fieldnames or []
-        is_combined = "onprem_time_sec" in fieldnames
-
-        for row in reader:
-            if is_combined:
-                processing_time = float(row["onprem_time_sec"])
-                # combined_results_final.csv has no c3d columns; all events are valid
-                c3d_valid = True
-                c3d_size_bytes = 0
-                exit_code = int(row.get("onprem_exit_code", 0))
-                gpu_model = row.get("onprem_gpu", "RTX_4000_Ada")
-                venue = _venue_from_event_name(row["event_name"])
-                fps_val = _fps_from_category(row.get("fps_category", ""))
-            else:
-                processing_time = float(row["processing_time_sec"])
-                c3d_valid = row["c3d_valid"].lower() == "true"
-                c3d_size_bytes = int(row["c3d_size_bytes"])
-                exit_code = int(row["exit_code"])
-                gpu_model = row.get("gpu_model", "RTX_4000_Ada")
-                venue = row["venue"]
-                fps_val = None
-
-            if processing_time < min_processing_time:
-                continue
-            if require_valid_c3d and not c3d_valid:
-                continue
-
-            meta = ledger.get(row["event_name"], {})
-
-            events.append(Event(
-                event_name=row["event_name"],
-                venue=venue,
-                venue_type=row.get("venue_type", "mlb"),
-                event_type=row["event_type"],
-                gpu_model=gpu_model,
-                processing_time_sec=processing_time,
-                exit_code=exit_code,
-                c3d_valid=c3d_valid,
-                c3d_size_bytes=c3d_size_bytes,
-                timestamp=row.get("timestamp"),
-                session=meta.get("session"),
-                fps=float(meta["fps"]) if meta.get("fps") else fps_val,
-                s3_path=meta.get("s3_path"),
-            ))
-
-    return events
+        lpath = lpath.resolve() if lpath is not None else None
+    return path, lpath
+
+
+@functools.lru_cache(maxsize=8)
+def _load_onprem_results_cached(
+    csv_path: str,
+    csv_mtime_ns: int,
+    min_processing_time: float,
+    require_valid_c3d: bool,
+    ledger_path: Optional[str],
+    ledger_mtime_ns: int,
+) -> Tuple[Event, ...]:
+    """Cached load_onprem_results; the mtimes only key the cache."""
+    return tuple(_iter_onprem_events(
+        csv_path, min_processing_time, require_valid_c3d, ledger_path
+    ))
+
+
+def _iter_onprem_events(
+    csv_path: str,
+    min_processing_time: float,
+    require_valid_c3d: bool,
+    ledger_path: Optional[str],
+) -> Iterator[Event]:
+    """Parse the results CSV column-wise, then build Events lazily."""
+    import pandas as pd
+
+    # Read everything as text (like csv.DictReader) and convert whole columns
+    df = pd.read_csv(csv_path, dtype=str, keep_default_na=False)
+    n = len(df)
+    is_combined = "onprem_time_sec" in df.columns
+
+    if is_combined:
+        processing_time = df["onprem_time_sec"].astype(float)
+        # combined_results_final.csv has no c3d columns; all events are valid
+        c3d_valid = pd.Series(True, index=df.index)
+        c3d_size_bytes = pd.Series(0, index=df.index)
+        exit_code = _int_column(df, "onprem_exit_code", 0)
+        gpu_model = _str_column(df, "onprem_gpu", "RTX_4000_Ada")
+        venue = df["event_name"].map(_venue_from_event_name)
+        fps_val = _str_column(df, "fps_category", "").map(_fps_from_category)
+    else:
+        processing_time = df["processing_time_sec"].astype(float)
+        c3d_valid = df["c3d_valid"].str.lower() == "true"
+        c3d_size_bytes = df["c3d_size_bytes"].astype(int)
+        exit_code = df["exit_code"].astype(int)
+        gpu_model = _str_column(df, "gpu_model", "RTX_4000_Ada")
+        venue = df["venue"]
+        fps_val = pd.Series([None] * n, index=df.index, dtype=object)
+
+    keep = processing_time >= min_processing_time
+    if require_valid_c3d:
+        keep &= c3d_valid
+    rows = df.index[keep.to_numpy()]
+
+    # Left-join the ledger on event_name; the last ledger row wins on duplicates.
+    # Only kept rows are joined, so a bad ledger value on a dropped event is ignored.
+    names = df.loc[rows, "event_name"]
+    session = pd.Series([None] * len(rows), index=rows, dtype=object)
+    fps = fps_val[rows].astype(object)
+    s3_path = pd.Series([None] * len(rows), index=rows, dtype=object)
+    if ledger_path is not None:
+        wanted = {"event_name", *LEDGER_JOIN_COLUMNS}
+        ledger = pd.read_csv(
+            ledger_path, dtype=str, keep_default_na=False, usecols=lambda c: c in wanted
+        )
+        ledger = ledger.drop_duplicates("event_name", keep="last").set_index("event_name")
+        meta = ledger.reindex(names, columns=list(LEDGER_JOIN_COLUMNS))
+        meta.index = rows
+        matched = names.isin(ledger.index)
+        session = meta["session"].astype(object).where(matched, None)
+        s3_path = meta["s3_path"].astype(object).where(matched, None)
+        has_fps = matched & (meta["fps"].fillna("") != "")
+        fps = fps.where(~has_fps, meta["fps"].where(has_fps).astype(float))
+
+    columns = zip(
+        df.loc[rows, "event_name"],
+        venue[rows],
+        _str_column(df, "venue_type", "mlb")[rows],
+        df.loc[rows, "event_type"],
+        gpu_model[rows],
+        processing_time[rows],
+        exit_code[rows],
+        c3d_valid[rows],
+        c3d_size_bytes[rows],
+        _str_column(df, "timestamp", None)[rows],
+        session,
+        fps,
+        s3_path,
+    )
+    # Event skips type coercion, so unwrap numpy scalars here
+    for name, ven, vtype, etype, gpu, ptime, code, valid, size, ts, sess, fps_value, s3 in columns:
+        yield Event(
+            event_name=name,
+            venue=ven,
+            venue_type=vtype,
+            event_type=etype,
+            gpu_model=gpu,
+            processing_time_sec=float(ptime),
+            exit_code=int(code),
+            c3d_valid=bool(valid),
+            c3d_size_bytes=int(size),
+            timestamp=ts,
+            session=sess,
+            fps=None if fps_value is None or pd.isna(fps_value) else float(fps_value),
+            s3_path=s3,
+        )
+
+
+def _str_column(df: pd.DataFrame, name: str, default: Optional[str]) -> pd.Series:
+    """Column as object dtype, or a constant default when the CSV lacks it."""
+    import pandas as pd
+
+    if name in df.columns:
+        return df[name]
+    return pd.Series([default] * len(df), index=df.index, dtype=object)
+
+
+def _int_column(df: pd.DataFrame, name: str, default: int) -> pd.Series:
+    """Integer column, or a constant default when the CSV lacks it."""
+    import pandas as pd
+
+    if name in df.columns:
+        return df[name].astype(int)
+    return pd.Series(default, index=df.index)
 
 
 def _venue_from_event_name(event_name: str) -> str:
@@ -169,23 +372,41 @@ def _venue_from_event_name(event_name: str) -> str:
     return "mlb"
 
 
+_FPS_BY_CATEGORY: Mapping[str, float] = MappingProxyType({"300": 300.0, "600": 600.0})
+
+
 def _fps_from_category(fps_category: str) -> Optional[float]:
     """Convert fps_category string to numeric fps value."""
-    if fps_category == "300":
-        return 300.0
-    elif fps_category == "600":
-        return 600.0
-    return None
+    return _FPS_BY_CATEGORY.get(fps_category)
 
 
 def sample_game_batch(
     events: List[Event],
     batch_size: int = 600,
+    seed: int = 42,
 ) -> List[Event]:
     """Resample events with replacement to reach realistic game-night batch size.
 
     Preserves the real processing time distribution from on-prem measurements.
     A typical MLB game produces ~500-700 biomechanical events.
     """
-    rng = random.Random(42)
-    return rng.choices(events, k=batch_size)
+    return [events[i] for i in _sample_indices(len(events), batch_size, seed)]
+
+
+def batch_key(events: List[Event]) -> bytes:
+    """Compact cache key for a batch: its processing times as raw bytes.
+
+    Sweeps depend on events only through their processing times, so this
+    keys cached sweeps without hashing every Event field.
+    """
+    return np.fromiter(
+        (e.processing_time_sec for e in events), dtype=float, count=len(events)
+    ).tobytes()
+
+
+@functools.lru_cache(maxsize=16)
+def _sample_indices(n_events: int, batch_size: int, seed: int) -> Tuple[int, ...]:
+    """Cached draw of batch indices; safe to share across equal-length event lists."""
+    # Draw all indices in one vectorized call on a fixed-seed PCG64 stream
+    idx = np.random.default_rng(seed).integers(0, n_events, size=batch_size)
+    return tuple(idx.tolist())
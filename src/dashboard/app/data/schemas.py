@@ -1,15 +1,30 @@
-"""Data models for cloud acceleration cost-benefit analysis."""
+"""Data models for cloud acceleration cost-benefit analysis.
 
-from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+User-facing configuration (CloudCostModel, SiteProfile) stays on pydantic
+for validation. Records built in bulk from trusted data (events, scheduler
+output, sweep points) are slotted frozen dataclasses.
+"""
 
+from __future__ import annotations
 
-class InstanceType(BaseModel):
+import functools
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class InstanceType:
     """AWS GPU instance type with pricing across all tiers.
 
     RI rates are Optional — some instances (e.g. p3.2xlarge) don't offer
     reserved pricing. Use available_pricing() to get the list of valid
     tiers, and rate_for_pricing() returns None for unavailable tiers.
+    Instances are static catalogue entries, hence a frozen slotted dataclass.
     """
 
     name: str           # "g4dn.xlarge"
@@ -21,34 +36,45 @@ class InstanceType(BaseModel):
     ratio: float        # cloud/on-prem processing time ratio
     has_real_data: bool = False
 
-    def rate_for_pricing(self, pricing: str) -> Optional[float]:
+    # Derived once in __post_init__; rates are looked up inside sweep loops
+    _rates: Dict[str, Optional[float]] = field(init=False, repr=False, compare=False)
+    _available: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
         rates: Dict[str, Optional[float]] = {
             "ondemand": self.rate_ondemand,
             "spot": self.rate_spot,
             "1yr_ri": self.rate_1yr_ri,
             "3yr_ri": self.rate_3yr_ri,
         }
-        return rates[pricing]
+        object.__setattr__(self, "_rates", rates)
+        object.__setattr__(
+            self, "_available", tuple(tier for tier, rate in rates.items() if rate is not None)
+        )
+
+    def rate_for_pricing(self, pricing: str) -> Optional[float]:
+        return self._rates[pricing]
 
     def available_pricing(self) -> List[str]:
         """Return list of pricing tiers that are available for this instance."""
-        tiers = ["ondemand", "spot"]
-        if self.rate_1yr_ri is not None:
-            tiers.append("1yr_ri")
-        if self.rate_3yr_ri is not None:
-            tiers.append("3yr_ri")
-        return tiers
+        return list(self._available)
+
 
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Event:
+    """One processed event from on-prem results CSV.
 
-class Event(BaseModel):
-    """One processed event from on-prem results CSV."""
+    A plain slotted dataclass rather than a pydantic model: events are built
+    in bulk from trusted in-repo CSVs, so per-field validation is skipped and
+    only the processing-time invariant is checked.
+    """
 
     event_name: str
     venue: str
     venue_type: str = "mlb"
     event_type: str  # Batting or Pitching
     gpu_model: str = "RTX_4000_Ada"
-    processing_time_sec: float = Field(..., gt=0)
+    processing_time_sec: float
     exit_code: int = 0
     c3d_valid: bool = True
     c3d_size_bytes: int = 0
@@ -59,8 +85,15 @@ class Event(BaseModel):
     fps: Optional[float] = None  # 300 or 600 — affects processing complexity
     s3_path: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        if not self.processing_time_sec > 0:
+            raise ValueError(
+                f"processing_time_sec must be > 0, got {self.processing_time_sec}"
+            )
 
-class EventAssignment(BaseModel):
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class EventAssignment:
     """Where a single event was assigned by the scheduler."""
 
     event_name: str
@@ -79,8 +112,12 @@ class CloudCostModel(BaseModel):
     - Fixed timing (legacy): cloud_time_per_event_sec is used directly
     - Ratio-based timing: cloud time = ratio * on_prem_time per event
     When ratio is set, it takes precedence over cloud_time_per_event_sec.
+
+    Frozen; derive variants with model_copy(update=...).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     instance_type: str = "g4dn.xlarge"
     cost_per_hour: float = 0.526  # AWS on-demand
     spot_cost_per_hour: Optional[float] = 0.16  # AWS spot estimate (~70% discount)
@@ -124,6 +161,24 @@ class CloudCostModel(BaseModel):
         compute_hours = processing / 3600.0
         return compute_hours * self.effective_cost_per_hour + self.data_transfer_cost_per_event
 
+    def vectorize(self, on_prem_times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-event (cloud_time, cloud_cost) arrays for a vector of on-prem times.
+
+        Element-wise equivalent of event_cloud_time_for / event_cloud_cost_for,
+        evaluated once per batch instead of once per event per configuration.
+        The spot-vs-on-demand rate is resolved here once for the whole batch,
+        so sweeps never take the per-event effective_cost_per_hour branch.
+        """
+        on_prem_times = np.asarray(on_prem_times, dtype=float)
+        rate = self.effective_cost_per_hour
+        if self.ratio is not None:
+            processing = self.ratio * on_prem_times
+        else:
+            processing = np.full_like(on_prem_times, self.cloud_time_per_event_sec)
+        times = processing + self.data_transfer_sec_per_event
+        costs = processing / 3600.0 * rate + self.data_transfer_cost_per_event
+        return times, costs
+
     def event_cloud_cost(self) -> float:
         """Total cloud cost for one event (compute + transfer). Legacy fixed-time mode."""
         compute_sec = self.cloud_time_per_event_sec + self.container_startup_sec
@@ -139,9 +194,13 @@ class CloudCostModel(BaseModel):
         )
 
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def from_instance(cls, instance: "InstanceType", pricing: str, **kwargs) -> "CloudCostModel":
         """Build a CloudCostModel from an InstanceType and pricing tier.
 
+        Memoized: both the instance and the resulting model are frozen, so
+        repeated sweeps share one model per (instance, pricing, kwargs).
+
         Raises ValueError if the pricing tier is not available for this instance.
         """
         rate = instance.rate_for_pricing(pricing)
@@ -160,7 +219,12 @@ class CloudCostModel(BaseModel):
 
 
 class SiteProfile(BaseModel):
-    """Stadium GPU configuration for simulation."""
+    """Stadium GPU configuration for simulation.
+
+    Frozen so profiles are hashable and can key memoized sweeps.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     name: str
     venue_code: str
@@ -180,7 +244,8 @@ class SiteProfile(BaseModel):
         return cls(name="GPU-Rich Site", venue_code="SEA", available_gpus=gpus, tier="gpu_rich")
 
 
-class BatchResult(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class BatchResult:
     """Output of one simulation run — one point in the sweep."""
 
     config_id: str  # e.g. "G5_C10"
@@ -197,7 +262,8 @@ class BatchResult(BaseModel):
     assignments: Optional[List[EventAssignment]] = None
 
 
-class ParetoPoint(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class ParetoPoint:
     """A point on the Pareto frontier."""
 
     config_id: str
@@ -208,5 +274,79 @@ class ParetoPoint(BaseModel):
     instance_type: Optional[str] = None   # "g4dn.xlarge"
     pricing_tier: Optional[str] = None    # "spot"
 
-    class Config:
-        frozen = True
+    @classmethod
+    def from_arrays(
+        cls,
+        config_ids: Sequence[str],
+        costs: Sequence[float],
+        times: Sequence[float],
+        is_pareto_optimal: Sequence[bool],
+        cloud_containers: Optional[Sequence[int]] = None,
+        instance_types: Optional[Sequence[Optional[str]]] = None,
+        pricing_tiers: Optional[Sequence[Optional[str]]] = None,
+    ) -> List["ParetoPoint"]:
+        """Build one ParetoPoint per row of parallel columns.
+
+        NumPy columns are converted to Python scalars in one call each rather
+        than element by element; omitted columns take the field defaults.
+        """
+        n = len(config_ids)
+
+        def column(values: Optional[Sequence[T]], default: T) -> Sequence[T]:
+            if values is None:
+                return [default] * n
+            return values.tolist() if isinstance(values, np.ndarray) else values
+
+        return [
+            cls(
+                config_id=config_id,
+                cost=cost,
+                time=time,
+                cloud_containers=cc,
+                is_pareto_optimal=optimal,
+                instance_type=inst,
+                pricing_tier=pricing,
+            )
+            for config_id, cost, time, optimal, cc, inst, pricing in zip(
+                config_ids,
+                column(costs, None),
+                column(times, None),
+                column(is_pareto_optimal, False),
+                column(cloud_containers, 0),
+                column(instance_types, None),
+                column(pricing_tiers, None),
+            )
+        ]
+
+
+@dataclass(slots=True, frozen=True, kw_only=True, eq=False)
+class ParetoSet:
+    """Column-wise view of a set of ParetoPoints.
+
+    Costs, times and the optimality mask are stored once as arrays for the
+    numeric routines; ``points`` keeps the per-point view for tables and charts.
+    Compared and hashed by identity: a generated __eq__ would compare arrays
+    with ==, and arrays are unhashable.
+    """
+
+    points: List[ParetoPoint]
+    costs: np.ndarray
+    times: np.ndarray
+    is_pareto_optimal: np.ndarray
+
+    @classmethod
+    def from_points(cls, points: List[ParetoPoint]) -> "ParetoSet":
+        n = len(points)
+        return cls(
+            points=points,
+            costs=np.fromiter((p.cost for p in points), dtype=float, count=n),
+            times=np.fromiter((p.time for p in points), dtype=float, count=n),
+            is_pareto_optimal=np.fromiter((p.is_pareto_optimal for p in points), dtype=bool, count=n),
+        )
+
+    def frontier_line(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(costs, times) of the Pareto-optimal points, ordered by cost."""
+        costs = self.costs[self.is_pareto_optimal]
+        times = self.times[self.is_pareto_optimal]
+        order = np.argsort(costs, kind="stable")
+        return costs[order], times[order]
@@ -3,17 +3,21 @@
 Run with: streamlit run main.py
 """
 
-import csv
 import sys
 from pathlib import Path
+from typing import Dict
 
-sys.path.insert(0, str(Path(__file__).parent))
+# Streamlit re-executes this script on every rerun; only add the app dir once
+APP_DIR = str(Path(__file__).parent)
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from config import settings
-from data.loaders import load_onprem_results, INSTANCE_TYPES, SITE_GPU_COUNTS, PRESET_SITE_PROFILES
+from data.loaders import load_onprem_results_df, INSTANCE_TYPES, SITE_GPU_COUNTS, PRESET_SITE_PROFILES
 
 st.set_page_config(
     page_title=settings.app_name,
@@ -24,8 +28,18 @@ st.set_page_config(
 
 
 @st.cache_data
-def load_events():
-    return load_onprem_results()
+def load_events_df() -> pd.DataFrame:
+    return load_onprem_results_df()
+
+
+@st.cache_data
+def load_combined_timings(path: str) -> Dict[str, np.ndarray]:
+    """On-prem/cloud timing arrays and per-event ratios from combined results."""
+    df = pd.read_csv(path, usecols=["onprem_time_sec", "cloud_time_sec"], dtype=np.float64)
+    onprem = df["onprem_time_sec"].to_numpy()
+    cloud = df["cloud_time_sec"].to_numpy()
+    measured = onprem > 0
+    return {"onprem": onprem, "cloud": cloud, "ratios": cloud[measured] / onprem[measured]}
 
 
 def main() -> None:
@@ -46,53 +60,46 @@ def main() -> None:
 
     st.divider()
 
-    events = load_events()
+    events = load_events_df()
+    # One counting pass per column, shared by both overview layouts below
+    type_counts = events["event_type"].value_counts()
+    fps_counts = events["fps"].value_counts()
 
     # --- Load combined results for cloud stats ---
     combined_path = Path(__file__).resolve().parent.parent.parent.parent / "docs" / "data" / "combined_results_final.csv"
-    onprem_times = []
-    cloud_times = []
-    ratios = []
+    onprem_times = cloud_times = ratios = np.empty(0)
     if combined_path.exists():
-        with open(combined_path, newline="") as f:
-            for row in csv.DictReader(f):
-                op = float(row["onprem_time_sec"])
-                ct = float(row["cloud_time_sec"])
-                onprem_times.append(op)
-                cloud_times.append(ct)
-                if op > 0:
-                    ratios.append(ct / op)
+        timings = load_combined_timings(str(combined_path))
+        onprem_times, cloud_times, ratios = timings["onprem"], timings["cloud"], timings["ratios"]
 
     # --- Processing Results Overview ---
     st.subheader("Processing Results Overview")
 
-    if onprem_times and cloud_times:
+    if onprem_times.size and cloud_times.size:
         col1, col2, col3 = st.columns(3)
 
         with col1:
             st.markdown("**On-Premises (RTX 4000 Ada)**")
-            avg_op = sum(onprem_times) / len(onprem_times)
-            st.metric("Events", len(onprem_times))
-            st.metric("Mean", f"{avg_op / 60:.1f} min")
-            st.metric("Range", f"{min(onprem_times) / 60:.1f} - {max(onprem_times) / 60:.1f} min")
+            st.metric("Events", onprem_times.size)
+            st.metric("Mean", f"{onprem_times.mean() / 60:.1f} min")
+            st.metric("Range", f"{onprem_times.min() / 60:.1f} - {onprem_times.max() / 60:.1f} min")
 
         with col2:
             st.markdown("**Cloud (Tesla T4)**")
-            avg_ct = sum(cloud_times) / len(cloud_times)
-            st.metric("Events", len(cloud_times))
-            st.metric("Mean", f"{avg_ct / 60:.1f} min")
-            st.metric("Range", f"{min(cloud_times) / 60:.1f} - {max(cloud_times) / 60:.1f} min")
+            st.metric("Events", cloud_times.size)
+            st.metric("Mean", f"{cloud_times.mean() / 60:.1f} min")
+            st.metric("Range", f"{cloud_times.min() / 60:.1f} - {cloud_times.max() / 60:.1f} min")
 
         with col3:
             st.markdown("**Comparison**")
-            avg_ratio = sum(ratios) / len(ratios)
+            avg_ratio = ratios.mean()
             st.metric("Cloud/On-Prem Ratio", f"{avg_ratio:.2f}x")
-            batting_count = sum(1 for e in events if e.event_type == "Batting")
-            pitching_count = sum(1 for e in events if e.event_type == "Pitching")
+            batting_count = type_counts.get("Batting", 0)
+            pitching_count = type_counts.get("Pitching", 0)
             st.metric("Batting / Pitching", f"{batting_count} / {pitching_count}")
-            fps_300 = [e for e in events if e.fps == 300]
-            fps_600 = [e for e in events if e.fps == 600]
-            st.metric("300fps / 600fps", f"{len(fps_300)} / {len(fps_600)}")
+            fps_300 = fps_counts.get(300.0, 0)
+            fps_600 = fps_counts.get(600.0, 0)
+            st.metric("300fps / 600fps", f"{fps_300} / {fps_600}")
 
         st.caption(
             "200 curated events processed on both platforms. "
@@ -105,14 +112,12 @@ def main() -> None:
         with col1:
             st.metric("Events Loaded", len(events))
         with col2:
-            avg_time = sum(e.processing_time_sec for e in events) / len(events)
+            avg_time = events["processing_time_sec"].mean()
             st.metric("Avg Processing Time", f"{avg_time / 60:.1f} min")
         with col3:
-            batting = len([e for e in events if e.event_type == "Batting"])
-            st.metric("Batting Events", batting)
+            st.metric("Batting Events", type_counts.get("Batting", 0))
         with col4:
-            pitching = len([e for e in events if e.event_type == "Pitching"])
-            st.metric("Pitching Events", pitching)
+            st.metric("Pitching Events", type_counts.get("Pitching", 0))
 
     # Site GPU profiles
     st.divider()
@@ -126,7 +131,7 @@ def main() -> None:
             "Tier": s.tier.replace("_", " ").title(),
         }
         for s in PRESET_SITE_PROFILES
-    ])
+    ]).astype({"Tier": "category"})
     st.dataframe(df_sites, use_container_width=True, hide_index=True)
 
     st.caption(
@@ -148,7 +153,7 @@ def main() -> None:
             "Cost/On-Prem-Hr": f"${it.rate_spot * it.ratio:.2f}",
         }
         for it in INSTANCE_TYPES
-    ])
+    ]).astype({"GPU": "category"})
     st.dataframe(df_instances, use_container_width=True, hide_index=True)
 
     st.caption(
@@ -3,6 +3,7 @@
 from .pareto import (
     compute_pareto_frontier,
     compute_pareto_frontier_numpy,
+    compute_pareto_set,
     find_optimal_configuration,
     generate_cloud_sweep,
 )
@@ -10,6 +11,7 @@ from .pareto import (
 __all__ = [
     "compute_pareto_frontier",
     "compute_pareto_frontier_numpy",
+    "compute_pareto_set",
     "find_optimal_configuration",
     "generate_cloud_sweep",
 ]
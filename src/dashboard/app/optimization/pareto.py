@@ -1,11 +1,11 @@
 """Pareto frontier optimization algorithms."""
 
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
-from data.schemas import CloudCostModel, Event, InstanceType, ParetoPoint, SiteProfile
-from simulation.scheduler import schedule_lpt
+from data.schemas import CloudCostModel, Event, InstanceType, ParetoPoint, ParetoSet, SiteProfile
+from simulation.scheduler import execute_plan, prepare_plan, schedule_lpt_sweep
 
 
 def is_dominated(point: Tuple[float, float], other: Tuple[float, float]) -> bool:
@@ -26,12 +26,51 @@ def is_dominated(point: Tuple[float, float], other: Tuple[float, float]) -> bool
     return cost_better_or_equal and time_better_or_equal and strictly_better
 
 
+def pareto_optimal_mask(costs: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """Boolean mask of non-dominated points, via a sort-and-sweep in O(n log n).
+
+    Points are sorted by (cost, time); a point is dominated iff some earlier
+    point that is not an exact duplicate of it has time <= its time. Exact
+    duplicates never dominate each other, matching is_dominated().
+    """
+    costs = np.asarray(costs, dtype=float)
+    times = np.asarray(times, dtype=float)
+    n = len(costs)
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+
+    order = np.lexsort((times, costs))
+    c, t = costs[order], times[order]
+
+    # Start index of each run of identical (cost, time) points
+    new_run = np.ones(n, dtype=bool)
+    new_run[1:] = (c[1:] != c[:-1]) | (t[1:] != t[:-1])
+    run_start = np.maximum.accumulate(np.where(new_run, np.arange(n), 0))
+
+    # Best time among all points sorted before each position
+    best_before = np.empty(n)
+    best_before[0] = np.inf
+    np.minimum.accumulate(t[:-1], out=best_before[1:])
+
+    mask = np.empty(n, dtype=bool)
+    mask[order] = best_before[run_start] > t
+    return mask
+
+
+def _cost_time_arrays(points: List[Tuple]) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack the (cost, time) columns of sweep tuples into float arrays."""
+    n = len(points)
+    costs = np.fromiter((p[1] for p in points), dtype=float, count=n)
+    times = np.fromiter((p[2] for p in points), dtype=float, count=n)
+    return costs, times
+
+
 def compute_pareto_frontier(
     points: List[Tuple[str, float, float]]
 ) -> List[ParetoPoint]:
     """Compute the Pareto frontier from a list of (config_id, cost, time) tuples.
 
-    Algorithm complexity: O(n^2) where n is the number of points.
+    Algorithm complexity: O(n log n) where n is the number of points.
 
     Args:
         points: List of (config_id, cost, time) tuples
@@ -39,37 +78,29 @@ def compute_pareto_frontier(
     Returns:
         List of ParetoPoint objects with is_pareto_optimal flag set
     """
-    n = len(points)
-    pareto_optimal = [True] * n
+    return compute_pareto_set(points).points
 
-    for i in range(n):
-        if not pareto_optimal[i]:
-            continue
 
-        for j in range(n):
-            if i == j:
-                continue
-
-            point_i = (points[i][1], points[i][2])  # (cost, time)
-            point_j = (points[j][1], points[j][2])
+def compute_pareto_set(
+    points: List[Tuple[str, float, float]]
+) -> ParetoSet:
+    """Like compute_pareto_frontier(), but also keeps the cost/time/mask arrays.
 
-            if is_dominated(point_i, point_j):
-                pareto_optimal[i] = False
-                break
+    Pass the result to find_optimal_configuration() to skip re-extracting
+    the numeric columns from the points.
+    """
+    costs, times = _cost_time_arrays(points)
+    mask = pareto_optimal_mask(costs, times)
 
-    result = []
-    for i, pt in enumerate(points):
-        config_id, cost, time = pt[0], pt[1], pt[2]
-        cc = pt[3] if len(pt) > 3 else 0
-        result.append(ParetoPoint(
-            config_id=config_id,
-            cost=cost,
-            time=time,
-            cloud_containers=cc,
-            is_pareto_optimal=pareto_optimal[i]
-        ))
+    result = ParetoPoint.from_arrays(
+        config_ids=[pt[0] for pt in points],
+        costs=[pt[1] for pt in points],
+        times=[pt[2] for pt in points],
+        is_pareto_optimal=mask,
+        cloud_containers=[pt[3] if len(pt) > 3 else 0 for pt in points],
+    )
 
-    return result
+    return ParetoSet(points=result, costs=costs, times=times, is_pareto_optimal=mask)
 
 
 def compute_pareto_frontier_numpy(
@@ -89,33 +120,11 @@ def compute_pareto_frontier_numpy(
     Returns:
         List of ParetoPoint objects
     """
-    n = len(costs)
-    pareto_optimal = np.ones(n, dtype=bool)
-
-    for i in range(n):
-        if not pareto_optimal[i]:
-            continue
-
-        cost_better = costs <= costs[i]
-        time_better = times <= times[i]
-        strictly_better = (costs < costs[i]) | (times < times[i])
-
-        dominates = cost_better & time_better & strictly_better
-        dominates[i] = False
-
-        if np.any(dominates):
-            pareto_optimal[i] = False
+    costs = np.asarray(costs, dtype=float)
+    times = np.asarray(times, dtype=float)
+    pareto_optimal = pareto_optimal_mask(costs, times)
 
-    result = []
-    for i in range(n):
-        result.append(ParetoPoint(
-            config_id=config_ids[i],
-            cost=float(costs[i]),
-            time=float(times[i]),
-            is_pareto_optimal=bool(pareto_optimal[i])
-        ))
-
-    return result
+    return ParetoPoint.from_arrays(config_ids, costs, times, pareto_optimal)
 
 
 def calculate_weighted_score(
@@ -139,41 +148,49 @@ def calculate_weighted_score(
 
 
 def find_optimal_configuration(
-    pareto_points: List[ParetoPoint],
+    pareto_points: Union[List[ParetoPoint], ParetoSet],
     cost_weight: float = 0.5
 ) -> ParetoPoint:
     """Find the optimal configuration from Pareto-optimal points based on weights.
 
     Args:
-        pareto_points: List of Pareto points (should be filtered to optimal only)
+        pareto_points: List of Pareto points (should be filtered to optimal only),
+            or a ParetoSet whose arrays are used directly
         cost_weight: Weight for cost optimization (0 = prioritize time, 1 = prioritize cost)
 
     Returns:
         The optimal ParetoPoint based on weighted scoring
     """
-    optimal_only = [p for p in pareto_points if p.is_pareto_optimal]
+    if not isinstance(pareto_points, ParetoSet):
+        pareto_points = ParetoSet.from_points(pareto_points)
+
+    optimal_idx = np.flatnonzero(pareto_points.is_pareto_optimal)
 
-    if not optimal_only:
-        return pareto_points[0] if pareto_points else None
+    if optimal_idx.size == 0:
+        return pareto_points.points[0] if pareto_points.points else None
 
-    costs = [p.cost for p in optimal_only]
-    times = [p.time for p in optimal_only]
+    costs = pareto_points.costs[optimal_idx]
+    times = pareto_points.times[optimal_idx]
 
-    cost_range = (min(costs), max(costs))
-    time_range = (min(times), max(times))
+    cost_range = (costs.min(), costs.max())
+    time_range = (times.min(), times.max())
 
-    best_point = None
-    best_score = float('inf')
+    # calculate_weighted_score is element-wise, so score every candidate at once;
+    # argmin keeps the first of any tied scores
+    scores = calculate_weighted_score(costs, times, cost_weight, cost_range, time_range)
+    return pareto_points.points[int(optimal_idx[np.argmin(scores)])]
 
-    for point in optimal_only:
-        score = calculate_weighted_score(
-            point.cost, point.time, cost_weight, cost_range, time_range
-        )
-        if score < best_score:
-            best_score = score
-            best_point = point
 
-    return best_point
+def sweep_baseline(points: List[ParetoPoint]) -> Optional[ParetoPoint]:
+    """The pure on-prem (C=0) point of a sweep, or None if it was not swept.
+
+    Both sweep generators emit C=0 first, and with no cloud containers it is
+    also the first zero-cost point, so this is a check of points[0] rather
+    than a scan for cost == 0.
+    """
+    if points and points[0].cloud_containers == 0:
+        return points[0]
+    return None
 
 
 def generate_cloud_sweep(
@@ -195,13 +212,10 @@ def generate_cloud_sweep(
         List of (config_id, cloud_cost, turnaround_time_sec) tuples
         suitable for compute_pareto_frontier().
     """
-    points: List[Tuple[str, float, float, int]] = []
-
-    for c in range(0, max_cloud_containers + 1, step):
-        result = schedule_lpt(events, site, c, cloud_model)
-        points.append((result.config_id, result.cloud_cost, result.turnaround_time_sec, c))
-
-    return points
+    # range() keeps the old error contract (step=0 raises ValueError)
+    c_values = list(range(0, max_cloud_containers + 1, step))
+    config_ids, costs, times = schedule_lpt_sweep(events, site, c_values, cloud_model)
+    return list(zip(config_ids, costs.tolist(), times.tolist(), c_values))
 
 
 def generate_multi_instance_sweep(
@@ -221,6 +235,10 @@ def generate_multi_instance_sweep(
         List of (config_id, cost, time, instance_name, pricing, cloud_containers) tuples.
     """
     points: List[Tuple[str, float, float, str, str, int]] = []
+    c_values = list(range(0, max_cloud_containers + 1, step))
+    # Instance and pricing only change the cost arithmetic, so every
+    # combination replays the same LPT order
+    plan = prepare_plan(events, site)
 
     for instance in instance_types:
         available = instance.available_pricing()
@@ -228,13 +246,13 @@ def generate_multi_instance_sweep(
             if pricing not in available:
                 continue
             cloud_model = CloudCostModel.from_instance(instance, pricing)
-            for c in range(0, max_cloud_containers + 1, step):
-                result = schedule_lpt(events, site, c, cloud_model)
-                config_id = f"{instance.gpu}_{pricing}_C{c}"
+            prefix = f"{instance.gpu}_{pricing}_C"
+            _, costs, times = execute_plan(plan, c_values, cloud_model)
+            for c, cost, time in zip(c_values, costs.tolist(), times.tolist()):
                 points.append((
-                    config_id,
-                    result.cloud_cost,
-                    result.turnaround_time_sec,
+                    prefix + str(c),
+                    cost,
+                    time,
                     instance.name,
                     pricing,
                     c,
@@ -254,35 +272,24 @@ def compute_pareto_frontier_multi(
     Returns:
         List of ParetoPoint objects with instance_type and pricing_tier set.
     """
-    n = len(points)
-    if n == 0:
-        return []
-
-    costs = np.array([p[1] for p in points])
-    times = np.array([p[2] for p in points])
-
-    pareto_optimal = np.ones(n, dtype=bool)
-
-    for i in range(n):
-        if not pareto_optimal[i]:
-            continue
-        dominates = (costs <= costs[i]) & (times <= times[i]) & ((costs < costs[i]) | (times < times[i]))
-        dominates[i] = False
-        if np.any(dominates):
-            pareto_optimal[i] = False
-
-    result = []
-    for i, pt in enumerate(points):
-        config_id, cost, time, inst, pricing = pt[0], pt[1], pt[2], pt[3], pt[4]
-        cc = pt[5] if len(pt) > 5 else 0
-        result.append(ParetoPoint(
-            config_id=config_id,
-            cost=cost,
-            time=time,
-            cloud_containers=cc,
-            is_pareto_optimal=bool(pareto_optimal[i]),
-            instance_type=inst,
-            pricing_tier=pricing,
-        ))
-
-    return result
+    return compute_pareto_set_multi(points).points
+
+
+def compute_pareto_set_multi(
+    points: List[Tuple],
+) -> ParetoSet:
+    """Like compute_pareto_frontier_multi(), but also keeps the cost/time/mask arrays."""
+    costs, times = _cost_time_arrays(points)
+    mask = pareto_optimal_mask(costs, times)
+
+    result = ParetoPoint.from_arrays(
+        config_ids=[pt[0] for pt in points],
+        costs=[pt[1] for pt in points],
+        times=[pt[2] for pt in points],
+        is_pareto_optimal=mask,
+        cloud_containers=[pt[5] if len(pt) > 5 else 0 for pt in points],
+        instance_types=[pt[3] for pt in points],
+        pricing_tiers=[pt[4] for pt in points],
+    )
+
+    return ParetoSet(points=result, costs=costs, times=times, is_pareto_optimal=mask)
@@ -0,0 +1,65 @@
+"""Disk-persisted sweeps shared by the dashboard pages.
+
+st.cache_data keys a cached function on its own source and arguments, not
+on the code it calls, so a persisted sweep would outlive a change to the
+scheduler or schemas. Every entry is therefore also keyed on
+SWEEP_CACHE_VERSION.
+"""
+
+from typing import List, Tuple
+
+import streamlit as st
+
+from data.loaders import INSTANCE_TYPES, PRICING_MODES, batch_key
+from data.schemas import CloudCostModel, Event, SiteProfile
+from optimization.pareto import generate_cloud_sweep, generate_multi_instance_sweep
+
+# Bump whenever sweep, scheduler or schema changes alter the cached results
+SWEEP_CACHE_VERSION = 1
+
+
+def cached_cloud_sweep(
+    batch: List[Event],
+    site: SiteProfile,
+    cloud_model: CloudCostModel,
+    max_cloud: int,
+) -> List[Tuple[str, float, float, int]]:
+    """generate_cloud_sweep, persisted across reruns and restarts.
+
+    The batch is keyed by batch_key() rather than hashed event by event.
+    """
+    return _cloud_sweep(SWEEP_CACHE_VERSION, batch_key(batch), site, cloud_model, max_cloud, batch)
+
+
+def cached_multi_instance_sweep(
+    batch: List[Event],
+    site: SiteProfile,
+    max_cloud: int,
+) -> List[Tuple[str, float, float, str, str, int]]:
+    """generate_multi_instance_sweep over the full catalogue, persisted like cached_cloud_sweep."""
+    return _multi_instance_sweep(SWEEP_CACHE_VERSION, batch_key(batch), site, max_cloud, batch)
+
+
+@st.cache_data(persist="disk", max_entries=256, show_spinner=False)
+def _cloud_sweep(
+    version: int,
+    key: bytes,
+    site: SiteProfile,
+    cloud_model: CloudCostModel,
+    max_cloud: int,
+    _batch: List[Event],
+) -> List[Tuple[str, float, float, int]]:
+    return generate_cloud_sweep(_batch, site, cloud_model, max_cloud_containers=max_cloud)
+
+
+@st.cache_data(persist="disk", max_entries=64, show_spinner=False)
+def _multi_instance_sweep(
+    version: int,
+    key: bytes,
+    site: SiteProfile,
+    max_cloud: int,
+    _batch: List[Event],
+) -> List[Tuple[str, float, float, str, str, int]]:
+    return generate_multi_instance_sweep(
+        _batch, site, INSTANCE_TYPES, PRICING_MODES, max_cloud_containers=max_cloud,
+    )
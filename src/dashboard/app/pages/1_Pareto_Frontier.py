@@ -1,35 +1,42 @@
 """Pareto Frontier - Cost vs. Turnaround Trade-off Analysis."""
 
 import sys
+from collections import Counter
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Streamlit re-executes this script on every rerun; only add the app dir once
+APP_DIR = str(Path(__file__).parent.parent)
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from components.charts import (
+    CONFIG_LABELS,
     INSTANCE_GPU_LABELS,
     create_multi_instance_pareto_chart,
     create_pareto_chart,
 )
 from config import settings
 from data.loaders import (
+    INSTANCE_OPTIONS,
+    INSTANCE_PRICING,
     INSTANCE_TYPES,
     PRICING_LABELS,
-    PRICING_MODES,
-    PRESET_SITE_PROFILES,
+    SITE_OPTIONS,
     load_onprem_results,
     sample_game_batch,
 )
 from data.schemas import CloudCostModel, SiteProfile
 from optimization.pareto import (
-    compute_pareto_frontier,
-    compute_pareto_frontier_multi,
+    compute_pareto_set,
+    compute_pareto_set_multi,
     find_optimal_configuration,
-    generate_cloud_sweep,
-    generate_multi_instance_sweep,
+    sweep_baseline,
 )
+from optimization.sweep_cache import cached_cloud_sweep, cached_multi_instance_sweep
 
 st.set_page_config(page_title="Pareto Frontier", page_icon=":chart_with_upwards_trend:", layout="wide")
 
@@ -46,9 +53,8 @@ events = load_events()
 # --- Sidebar controls ---
 st.sidebar.header("Simulation Parameters")
 
-site_options = {s.name: s for s in PRESET_SITE_PROFILES}
-site_name = st.sidebar.selectbox("Site Profile", list(site_options.keys()), index=1)
-site = site_options[site_name]
+site_name = st.sidebar.selectbox("Site Profile", list(SITE_OPTIONS), index=1)
+site = SITE_OPTIONS[site_name]
 
 custom_gpus = st.sidebar.number_input(
     "Override GPU Count", min_value=1, max_value=100,
@@ -91,13 +97,12 @@ if analysis_mode == "Single Instance":
     st.sidebar.divider()
     st.sidebar.subheader("Cloud Configuration")
 
-    instance_options = {f"{it.gpu} ({it.name})": it for it in INSTANCE_TYPES}
     instance_label = st.sidebar.selectbox(
         "GPU Instance Type",
-        list(instance_options.keys()),
+        list(INSTANCE_OPTIONS),
         index=2,  # Default to L4
     )
-    selected_instance = instance_options[instance_label]
+    selected_instance = INSTANCE_OPTIONS[instance_label]
 
     available_tiers = selected_instance.available_pricing()
     pricing_tier = st.sidebar.radio(
@@ -129,15 +134,27 @@ if analysis_mode == "Multi-Instance":
     )
 
     with st.spinner("Running multi-instance sweep..."):
-        raw_points = generate_multi_instance_sweep(
-            batch, site, INSTANCE_TYPES, PRICING_MODES,
-            max_cloud_containers=max_cloud,
-        )
-        all_points = compute_pareto_frontier_multi(raw_points)
-
-    frontier_points = [p for p in all_points if p.is_pareto_optimal]
-    dominated_points = [p for p in all_points if not p.is_pareto_optimal]
-    optimal = find_optimal_configuration(all_points, cost_weight=cost_weight)
+        raw_points = cached_multi_instance_sweep(batch, site, max_cloud)
+        pareto_set = compute_pareto_set_multi(raw_points)
+        all_points = pareto_set.points
+
+    # One pass over the sweep: frontier list, dominated count and per-pair tallies
+    frontier_points = []
+    dominated_count = 0
+    pair_counts = Counter()
+    for p in all_points:
+        if p.is_pareto_optimal:
+            frontier_points.append(p)
+            pair_counts[(p.instance_type, p.pricing_tier)] += 1
+        else:
+            dominated_count += 1
+
+    # Per-GPU totals feed the metric row and the share table
+    gpu_counts = Counter()
+    for (inst_name, _), count in pair_counts.items():
+        gpu_counts[inst_name or "unknown"] += count
+
+    optimal = find_optimal_configuration(pareto_set, cost_weight=cost_weight)
 
     # Metrics row
     col1, col2, col3, col4 = st.columns(4)
@@ -146,17 +163,13 @@ if analysis_mode == "Multi-Instance":
     with col2:
         st.metric("Frontier Points", len(frontier_points))
     with col3:
-        dominated_pct = len(dominated_points) / len(all_points) * 100 if all_points else 0
+        dominated_pct = dominated_count / len(all_points) * 100 if all_points else 0
         st.metric("Dominated", f"{dominated_pct:.0f}%")
     with col4:
-        gpu_counts = {}
-        for p in frontier_points:
-            label = p.instance_type or "unknown"
-            gpu_counts[label] = gpu_counts.get(label, 0) + 1
         if gpu_counts:
-            top_gpu = max(gpu_counts, key=gpu_counts.get)
+            (top_gpu, top_count), = gpu_counts.most_common(1)
             top_label = INSTANCE_GPU_LABELS.get(top_gpu, top_gpu)
-            st.metric("Top GPU", f"{top_label} ({gpu_counts[top_gpu]})")
+            st.metric("Top GPU", f"{top_label} ({top_count})")
 
     st.divider()
 
@@ -172,20 +185,18 @@ if analysis_mode == "Multi-Instance":
     st.subheader("Frontier Composition")
 
     frontier_rows = []
-    for inst in INSTANCE_TYPES:
-        for pricing in inst.available_pricing():
-            count = sum(1 for p in frontier_points
-                        if p.instance_type == inst.name and p.pricing_tier == pricing)
-            if count > 0:
-                rate = inst.rate_for_pricing(pricing)
-                frontier_rows.append({
-                    "GPU": inst.gpu,
-                    "Instance": inst.name,
-                    "Pricing": PRICING_LABELS[pricing],
-                    "Rate ($/hr)": f"${rate:.3f}",
-                    "Ratio": f"{inst.ratio:.3f}x",
-                    "Frontier Points": count,
-                })
+    for inst, pricing in INSTANCE_PRICING:
+        count = pair_counts[(inst.name, pricing)]
+        if count > 0:
+            rate = inst.rate_for_pricing(pricing)
+            frontier_rows.append({
+                "GPU": inst.gpu,
+                "Instance": inst.name,
+                "Pricing": PRICING_LABELS[pricing],
+                "Rate ($/hr)": f"${rate:.3f}",
+                "Ratio": f"{inst.ratio:.3f}x",
+                "Frontier Points": count,
+            })
 
     if frontier_rows:
         st.dataframe(pd.DataFrame(frontier_rows), use_container_width=True, hide_index=True)
@@ -195,7 +206,7 @@ if analysis_mode == "Multi-Instance":
         st.subheader("GPU Share of Frontier")
         share_rows = []
         for inst in INSTANCE_TYPES:
-            count = gpu_counts.get(inst.name, 0)
+            count = gpu_counts[inst.name]
             pct = count / len(frontier_points) * 100 if frontier_points else 0
             share_rows.append({
                 "GPU": inst.gpu,
@@ -208,12 +219,14 @@ if analysis_mode == "Multi-Instance":
     if optimal:
         st.divider()
         st.subheader("Recommendation")
-        baseline = next((p for p in all_points if p.cost == 0), None)
+        baseline = sweep_baseline(all_points)
 
         col1, col2, col3, col4 = st.columns(4)
         with col1:
-            gpu_label = INSTANCE_GPU_LABELS.get(optimal.instance_type or "", optimal.instance_type or "")
-            pricing_label = PRICING_LABELS.get(optimal.pricing_tier or "", optimal.pricing_tier or "")
+            gpu_label, pricing_label = CONFIG_LABELS.get(
+                (optimal.instance_type, optimal.pricing_tier),
+                (optimal.instance_type or "", optimal.pricing_tier or ""),
+            )
             st.metric("Config", f"{gpu_label} {pricing_label}")
         with col2:
             st.metric("Containers", optimal.cloud_containers)
@@ -237,9 +250,10 @@ else:
     )
 
     cloud_model = CloudCostModel.from_instance(selected_instance, pricing_tier)
-    sweep = generate_cloud_sweep(batch, site, cloud_model, max_cloud_containers=max_cloud)
-    frontier = compute_pareto_frontier(sweep)
-    optimal = find_optimal_configuration(frontier, cost_weight=cost_weight)
+    sweep = cached_cloud_sweep(batch, site, cloud_model, max_cloud)
+    pareto_set = compute_pareto_set(sweep)
+    frontier = pareto_set.points
+    optimal = find_optimal_configuration(pareto_set, cost_weight=cost_weight)
 
     # Metrics row
     col1, col2, col3, col4 = st.columns(4)
@@ -248,7 +262,7 @@ else:
     with col2:
         st.metric("Batch Events", batch_size)
     with col3:
-        pareto_count = sum(1 for p in frontier if p.is_pareto_optimal)
+        pareto_count = int(pareto_set.is_pareto_optimal.sum())
         st.metric("Pareto-Optimal Points", pareto_count)
     with col4:
         if optimal:
@@ -265,22 +279,35 @@ else:
 
     # Summary table
     st.subheader("Pareto-Optimal Configurations")
-    optimal_points = sorted([p for p in frontier if p.is_pareto_optimal], key=lambda p: p.cost)
-
-    df = pd.DataFrame([
-        {
-            "Config": p.config_id,
-            "Containers": p.cloud_containers,
-            "Cloud Cost": f"${p.cost:.2f}",
-            "Turnaround": f"{p.time / 3600:.1f} hrs",
-            "Selected": ">>>" if optimal and p.config_id == optimal.config_id else "",
-        }
-        for p in optimal_points
-    ])
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    # Filter to the frontier and order by cost on the set's arrays; stable like sorted()
+    idx = np.flatnonzero(pareto_set.is_pareto_optimal)
+    idx = idx[np.argsort(pareto_set.costs[idx], kind="stable")]
+    optimal_points = [frontier[i] for i in idx.tolist()]
+
+    n_optimal = len(optimal_points)
+    config_ids = np.array([p.config_id for p in optimal_points], dtype=object)
+    selected_id = optimal.config_id if optimal else None
+    df = pd.DataFrame({
+        "Config": config_ids,
+        "Containers": np.fromiter((p.cloud_containers for p in optimal_points), dtype=int, count=n_optimal),
+        "Cloud Cost": pareto_set.costs[idx],
+        "Turnaround": pareto_set.times[idx] / 3600,
+        "Selected": np.where(config_ids == selected_id, ">>>", ""),
+    }, copy=False)
+
+    # Numeric columns are formatted by the grid, not per cell in Python
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Cloud Cost": st.column_config.NumberColumn(format="$%.2f"),
+            "Turnaround": st.column_config.NumberColumn(format="%.1f hrs"),
+        },
+    )
 
     # Baseline comparison
-    baseline = next((p for p in frontier if p.cost == 0), None)
+    baseline = sweep_baseline(frontier)
     if baseline and optimal and optimal.config_id != baseline.config_id:
         st.divider()
         st.subheader("Recommendation vs. Baseline")
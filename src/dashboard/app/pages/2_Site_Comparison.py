@@ -3,22 +3,28 @@
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Streamlit re-executes this script on every rerun; only add the app dir once
+APP_DIR = str(Path(__file__).parent.parent)
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
 
+import pandas as pd
 import streamlit as st
 
 from components.charts import create_multi_site_chart
 from config import settings
 from data.loaders import (
-    INSTANCE_TYPES,
+    INSTANCE_OPTIONS,
     PRICING_LABELS,
     PRICING_MODES,
     PRESET_SITE_PROFILES,
+    SITE_OPTIONS,
     load_onprem_results,
     sample_game_batch,
 )
 from data.schemas import CloudCostModel
-from optimization.pareto import compute_pareto_frontier, generate_cloud_sweep
+from optimization.pareto import compute_pareto_frontier, sweep_baseline
+from optimization.sweep_cache import cached_cloud_sweep
 
 st.set_page_config(page_title="Site Comparison", page_icon=":bar_chart:", layout="wide")
 
@@ -46,13 +52,12 @@ x_axis = st.sidebar.radio("X-Axis", ["Cloud Containers Added", "Additional Cloud
 st.sidebar.divider()
 st.sidebar.subheader("Cloud Configuration")
 
-instance_options = {f"{it.gpu} ({it.name})": it for it in INSTANCE_TYPES}
 instance_label = st.sidebar.selectbox(
     "GPU Instance Type",
-    list(instance_options.keys()),
+    list(INSTANCE_OPTIONS),
     index=2,  # Default to L4
 )
-selected_instance = instance_options[instance_label]
+selected_instance = INSTANCE_OPTIONS[instance_label]
 
 available_tiers = selected_instance.available_pricing()
 pricing_tier = st.sidebar.radio(
@@ -67,7 +72,7 @@ st.sidebar.subheader("Select Sites")
 
 selected_sites = st.sidebar.multiselect(
     "Sites to Compare",
-    [s.name for s in PRESET_SITE_PROFILES],
+    list(SITE_OPTIONS),
     default=[s.name for s in PRESET_SITE_PROFILES[:4]],
 )
 
@@ -82,14 +87,13 @@ for profile in PRESET_SITE_PROFILES:
     if profile.name not in selected_sites:
         continue
 
-    sweep = generate_cloud_sweep(batch, profile, cloud_model, max_cloud_containers=max_cloud)
-    frontier = compute_pareto_frontier(sweep)
+    frontier = compute_pareto_frontier(cached_cloud_sweep(batch, profile, cloud_model, max_cloud))
 
     label = f"{profile.name} ({profile.available_gpus} GPUs)"
     site_frontiers[label] = (frontier, profile.tier)
 
     optimal_points = [p for p in frontier if p.is_pareto_optimal]
-    baseline = next((p for p in frontier if p.cost == 0), None)
+    baseline = sweep_baseline(frontier)
     best_time = min(p.time for p in frontier) if frontier else 0
 
     site_details.append({
@@ -112,7 +116,6 @@ if site_frontiers:
     st.plotly_chart(fig, use_container_width=True)
 
     st.subheader("Site Summary")
-    import pandas as pd
     st.dataframe(pd.DataFrame(site_details), use_container_width=True, hide_index=True)
 
     if len(site_details) >= 2:
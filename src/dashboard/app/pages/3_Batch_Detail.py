@@ -3,8 +3,12 @@
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Streamlit re-executes this script on every rerun; only add the app dir once
+APP_DIR = str(Path(__file__).parent.parent)
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -15,10 +19,10 @@ from components.charts import (
 )
 from config import settings
 from data.loaders import (
-    INSTANCE_TYPES,
+    INSTANCE_OPTIONS,
     PRICING_LABELS,
     PRICING_MODES,
-    PRESET_SITE_PROFILES,
+    SITE_OPTIONS,
     load_onprem_results,
     sample_game_batch,
 )
@@ -44,9 +48,8 @@ events = load_events()
 # --- Sidebar ---
 st.sidebar.header("Simulation Setup")
 
-site_options = {s.name: s for s in PRESET_SITE_PROFILES}
-site_name = st.sidebar.selectbox("Site Profile", list(site_options.keys()), index=1)
-site = site_options[site_name]
+site_name = st.sidebar.selectbox("Site Profile", list(SITE_OPTIONS), index=1)
+site = SITE_OPTIONS[site_name]
 
 cloud_containers = st.sidebar.slider("Cloud Containers", 0, 50, 10)
 batch_size = st.sidebar.slider("Batch Size", 100, 1200, settings.default_batch_size, step=50)
@@ -54,13 +57,12 @@ batch_size = st.sidebar.slider("Batch Size", 100, 1200, settings.default_batch_s
 st.sidebar.divider()
 st.sidebar.subheader("Cloud Configuration")
 
-instance_options = {f"{it.gpu} ({it.name})": it for it in INSTANCE_TYPES}
 instance_label = st.sidebar.selectbox(
     "GPU Instance Type",
-    list(instance_options.keys()),
+    list(INSTANCE_OPTIONS),
     index=2,  # Default to L4
 )
-selected_instance = instance_options[instance_label]
+selected_instance = INSTANCE_OPTIONS[instance_label]
 
 available_tiers = selected_instance.available_pricing()
 pricing_tier = st.sidebar.radio(
@@ -128,20 +130,30 @@ if result.assignments:
     st.divider()
     st.subheader("Event Assignments")
 
-    df = pd.DataFrame([
-        {
-            "Event": a.event_name[:30],
-            "Type": a.event_type,
-            "On-Prem Time (min)": f"{a.processing_time_sec / 60:.1f}",
-            "Assigned To": a.assigned_to.replace("_", " ").title(),
-            "Processor": a.processor_id,
-            "Effective Time (min)": f"{a.effective_time_sec / 60:.1f}",
-            "FPS": int(a.fps) if a.fps else "",
-        }
-        for a in result.assignments
-    ])
-
-    st.dataframe(df, use_container_width=True, hide_index=True, height=400)
+    assignments = result.assignments
+    location_labels = {"on_prem": "On Prem", "cloud": "Cloud"}
+    df = pd.DataFrame({
+        "Event": [a.event_name[:30] for a in assignments],
+        "Type": [a.event_type for a in assignments],
+        "On-Prem Time (min)": np.array([a.processing_time_sec for a in assignments]) / 60,
+        "Assigned To": [location_labels[a.assigned_to] for a in assignments],
+        "Processor": np.array([a.processor_id for a in assignments]),
+        "Effective Time (min)": np.array([a.effective_time_sec for a in assignments]) / 60,
+        "FPS": np.array([a.fps if a.fps is not None else np.nan for a in assignments]),
+    }, copy=False)
+
+    # Numeric columns are formatted by the grid, not per cell in Python
+    st.dataframe(
+        df,
+        use_container_width=True,
+        hide_index=True,
+        height=400,
+        column_config={
+            "On-Prem Time (min)": st.column_config.NumberColumn(format="%.1f"),
+            "Effective Time (min)": st.column_config.NumberColumn(format="%.1f"),
+            "FPS": st.column_config.NumberColumn(format="%d"),
+        },
+    )
 
     cloud_events = [a for a in result.assignments if a.assigned_to == "cloud"]
     prem_events = [a for a in result.assignments if a.assigned_to == "on_prem"]
@@ -3,7 +3,10 @@
 import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Streamlit re-executes this script on every rerun; only add the app dir once
+APP_DIR = str(Path(__file__).parent.parent)
+if APP_DIR not in sys.path:
+    sys.path.insert(0, APP_DIR)
 
 import pandas as pd
 import streamlit as st
@@ -13,12 +16,13 @@ from config import settings
 from data.loaders import (
     INSTANCE_TYPES,
     PRICING_LABELS,
-    PRESET_SITE_PROFILES,
+    SITE_OPTIONS,
     load_onprem_results,
     sample_game_batch,
 )
 from data.schemas import CloudCostModel
-from optimization.pareto import compute_pareto_frontier, generate_cloud_sweep
+from optimization.pareto import compute_pareto_frontier, sweep_baseline
+from optimization.sweep_cache import cached_cloud_sweep
 
 st.set_page_config(page_title="Sensitivity Analysis", page_icon=":bar_chart:", layout="wide")
 
@@ -39,9 +43,8 @@ events = load_events()
 # --- Sidebar ---
 st.sidebar.header("Base Configuration")
 
-site_options = {s.name: s for s in PRESET_SITE_PROFILES}
-site_name = st.sidebar.selectbox("Site Profile", list(site_options.keys()), index=1)
-site = site_options[site_name]
+site_name = st.sidebar.selectbox("Site Profile", list(SITE_OPTIONS), index=1)
+site = SITE_OPTIONS[site_name]
 
 batch_size = st.sidebar.slider("Batch Size", 100, 1200, settings.default_batch_size, step=50)
 max_cloud = st.sidebar.slider("Max Cloud Containers", 5, 100, settings.default_max_cloud, step=5)
@@ -62,7 +65,7 @@ if sensitivity_var == "Hourly Rate":
     rates = [0.25, 0.526, 0.75, 1.00, 1.50]
     for rate in rates:
         model = CloudCostModel(cost_per_hour=rate, ratio=2.18)
-        sweep = generate_cloud_sweep(batch, site, model, max_cloud_containers=max_cloud)
+        sweep = cached_cloud_sweep(batch, site, model, max_cloud)
         frontier = compute_pareto_frontier(sweep)
         frontiers[f"${rate:.3f}/hr"] = frontier
     param_name = "Cloud Hourly Rate"
@@ -70,7 +73,7 @@ if sensitivity_var == "Hourly Rate":
 elif sensitivity_var == "Processing Time":
     for inst in INSTANCE_TYPES:
         model = CloudCostModel.from_instance(inst, "spot")
-        sweep = generate_cloud_sweep(batch, site, model, max_cloud_containers=max_cloud)
+        sweep = cached_cloud_sweep(batch, site, model, max_cloud)
         frontier = compute_pareto_frontier(sweep)
         frontiers[f"{inst.gpu} ({inst.ratio:.2f}x)"] = frontier
     param_name = "GPU Processing Speed (Spot Pricing)"
@@ -79,7 +82,7 @@ else:  # Pricing Model (All GPUs)
     for inst in INSTANCE_TYPES:
         for pricing in inst.available_pricing():
             model = CloudCostModel.from_instance(inst, pricing)
-            sweep = generate_cloud_sweep(batch, site, model, max_cloud_containers=max_cloud)
+            sweep = cached_cloud_sweep(batch, site, model, max_cloud)
             frontier = compute_pareto_frontier(sweep)
             label = f"{inst.gpu} {PRICING_LABELS[pricing]}"
             frontiers[label] = frontier
@@ -96,7 +99,7 @@ for label, points in frontiers.items():
     optimal = [p for p in points if p.is_pareto_optimal]
     if not optimal:
         continue
-    baseline = next((p for p in optimal if p.cost == 0), optimal[0])
+    baseline = sweep_baseline(points) or optimal[0]
     fastest = min(optimal, key=lambda p: p.time)
 
     rows.append({
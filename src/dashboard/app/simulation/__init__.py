@@ -1,5 +1,5 @@
 """Batch scheduling simulation."""
 
-from .scheduler import schedule_lpt
+from .scheduler import LptPlan, execute_plan, prepare_plan, schedule_lpt, schedule_lpt_sweep
 
-__all__ = ["schedule_lpt"]
+__all__ = ["LptPlan", "execute_plan", "prepare_plan", "schedule_lpt", "schedule_lpt_sweep"]
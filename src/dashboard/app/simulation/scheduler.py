@@ -10,7 +10,10 @@ or a fixed time for backward compatibility.
 """
 
 import heapq
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from data.schemas import BatchResult, CloudCostModel, Event, EventAssignment, SiteProfile
 
@@ -49,7 +52,15 @@ def schedule_lpt(
         raise ValueError("Must have at least one processor (on-prem GPU or cloud container)")
 
     # Sort events by processing time descending (LPT)
-    sorted_events = sorted(events, key=lambda e: e.processing_time_sec, reverse=True)
+    plan = prepare_plan(events, site)
+    sorted_events = plan.sorted_events
+
+    # Cloud time/cost depend only on each event's on-prem time, so price the
+    # whole batch up front rather than calling the cost model per event
+    if cloud_containers > 0:
+        times_arr, costs_arr = cloud_model.vectorize(plan.on_prem_times)
+        cloud_times: List[float] = times_arr.tolist()
+        cloud_costs: List[float] = costs_arr.tolist()
 
     # Min-heap: (current_load_sec, processor_index, is_cloud)
     # Cloud processors start with container startup overhead
@@ -64,12 +75,12 @@ def schedule_lpt(
     total_cloud_cost = 0.0
     assignments: Optional[List[EventAssignment]] = [] if track_assignments else None
 
-    for event in sorted_events:
+    for idx, event in enumerate(sorted_events):
         load, proc_id, is_cloud = heapq.heappop(heap)
 
         if is_cloud:
-            event_time = cloud_model.event_cloud_time_for(event.processing_time_sec)
-            total_cloud_cost += cloud_model.event_cloud_cost_for(event.processing_time_sec)
+            event_time = cloud_times[idx]
+            total_cloud_cost += cloud_costs[idx]
             cloud_event_count += 1
         else:
             event_time = event.processing_time_sec
@@ -116,3 +127,96 @@ def schedule_lpt(
         cloud_finish_sec=cloud_finish,
         assignments=assignments,
     )
+
+
+@dataclass(slots=True, frozen=True)
+class LptPlan:
+    """Per-batch scheduling work shared by every configuration in a sweep.
+
+    The LPT order depends only on the events, so it is computed once and
+    reused across container counts, instance types and pricing tiers.
+    """
+
+    on_prem_gpus: int
+    sorted_events: List[Event]
+    on_prem_times: np.ndarray  # Sorted descending, aligned with sorted_events
+
+
+def prepare_plan(events: List[Event], site: SiteProfile) -> LptPlan:
+    """Sort a batch into LPT order once for reuse by execute_plan()."""
+    sorted_events = sorted(events, key=lambda e: e.processing_time_sec, reverse=True)
+    on_prem_times = np.fromiter(
+        (e.processing_time_sec for e in sorted_events), dtype=float, count=len(sorted_events)
+    )
+    return LptPlan(
+        on_prem_gpus=site.available_gpus,
+        sorted_events=sorted_events,
+        on_prem_times=on_prem_times,
+    )
+
+
+def execute_plan(
+    plan: LptPlan,
+    c_values: Sequence[int],
+    cloud_model: CloudCostModel,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Replay the LPT heap assignment of a prepared plan for each container count.
+
+    Cloud time/cost is priced for every event once per cost model; each
+    container count then only replays the heap assignment.
+
+    Returns:
+        (config_ids, cloud_costs, turnaround_times_sec), aligned with c_values.
+        Each entry matches the corresponding schedule_lpt() result exactly.
+    """
+    on_prem_gpus = plan.on_prem_gpus
+    times_arr, costs_arr = cloud_model.vectorize(plan.on_prem_times)
+    prem_times: List[float] = plan.on_prem_times.tolist()
+    cloud_times: List[float] = times_arr.tolist()
+    cloud_costs: List[float] = costs_arr.tolist()
+    startup = cloud_model.container_startup_sec
+
+    config_ids: List[str] = []
+    costs = np.empty(len(c_values))
+    makespans = np.empty(len(c_values))
+
+    for k, cloud_containers in enumerate(c_values):
+        cloud_containers = int(cloud_containers)
+        if on_prem_gpus + cloud_containers == 0:
+            raise ValueError("Must have at least one processor (on-prem GPU or cloud container)")
+
+        heap: List[tuple] = [(0.0, i, False) for i in range(on_prem_gpus)]
+        heap.extend(
+            (startup, on_prem_gpus + i, True) for i in range(cloud_containers)
+        )
+        heapq.heapify(heap)
+
+        total_cloud_cost = 0.0
+        for idx, prem_time in enumerate(prem_times):
+            load, proc_id, is_cloud = heap[0]
+            if is_cloud:
+                event_time = cloud_times[idx]
+                total_cloud_cost += cloud_costs[idx]
+            else:
+                event_time = prem_time
+            heapq.heapreplace(heap, (load + event_time, proc_id, is_cloud))
+
+        config_ids.append(f"G{on_prem_gpus}_C{cloud_containers}")
+        costs[k] = total_cloud_cost
+        makespans[k] = max(load for load, _, _ in heap)
+
+    return config_ids, costs, makespans
+
+
+def schedule_lpt_sweep(
+    events: List[Event],
+    site: SiteProfile,
+    c_values: Sequence[int],
+    cloud_model: CloudCostModel,
+) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Run schedule_lpt for every cloud container count in c_values.
+
+    Shorthand for execute_plan(prepare_plan(events, site), c_values, cloud_model).
+    Sweeps over several cost models should prepare the plan once themselves.
+    """
+    return execute_plan(prepare_plan(events, site), c_values, cloud_model)
@@ -0,0 +1,281 @@
+"""Tests for the CSV data loaders."""
+
+import csv
+import dataclasses
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import pandas as pd
+import pytest
+
+from data.loaders import (
+    _fps_from_category,
+    _iter_onprem_events,
+    _venue_from_event_name,
+    iter_onprem_results,
+    load_event_ledger,
+    load_onprem_results,
+    load_onprem_results_df,
+)
+from data.schemas import Event
+
+
+LEDGER_CSV = (
+    "event_name,session,fps,s3_path\n"
+    "ev_a,2024_S1,300,s3://bucket/ev_a\n"
+    "ev_b,2024_S2,,s3://bucket/ev_b\n"
+)
+
+
+class TestLoadEventLedger:
+    """Tests for the cached event ledger loader."""
+
+    def test_rows_keyed_by_event_name(self, tmp_path: Path) -> None:
+        path = tmp_path / "ledger.csv"
+        path.write_text(LEDGER_CSV)
+        ledger = load_event_ledger(str(path))
+
+        assert set(ledger) == {"ev_a", "ev_b"}
+        assert ledger["ev_a"]["fps"] == "300"
+
+    def test_columns_subset(self, tmp_path: Path) -> None:
+        path = tmp_path / "ledger.csv"
+        path.write_text(LEDGER_CSV)
+        ledger = load_event_ledger(str(path), columns=("session", "missing"))
+
+        assert ledger["ev_b"] == {"session": "2024_S2"}
+
+    def test_cached_ledger_is_read_only(self, tmp_path: Path) -> None:
+        path = tmp_path / "ledger.csv"
+        path.write_text(LEDGER_CSV)
+        ledger = load_event_ledger(str(path))
+
+        with pytest.raises(TypeError):
+            ledger["ev_a"]["session"] = "changed"
+        with pytest.raises(TypeError):
+            del ledger["ev_b"]
+        # Unchanged file: the same cached view, not a rebuilt copy
+        assert load_event_ledger(str(path)) is ledger
+
+    def test_rewritten_file_invalidates_cache(self, tmp_path: Path) -> None:
+        path = tmp_path / "ledger.csv"
+        path.write_text(LEDGER_CSV)
+        assert load_event_ledger(str(path))["ev_a"]["session"] == "2024_S1"
+
+        path.write_text(LEDGER_CSV.replace("2024_S1", "2025_S9"))
+        # Force a distinct mtime even on filesystems with coarse timestamps
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_event_ledger(str(path))["ev_a"]["session"] == "2025_S9"
+
+
+LEGACY_CSV = (
+    "event_name,venue,event_type,processing_time_sec,exit_code,c3d_valid,c3d_size_bytes,gpu_model,timestamp\n"
+    "ev_a,NYY,Batting,120.5,0,True,1024,RTX_4000_Ada,2024-04-01T19:05:00\n"
+    "ev_b,BOS,Pitching,45.0,0,True,2048,RTX_4000_Ada,2024-04-01T19:06:00\n"
+    "ev_c,NYY,Pitching,300,1,False,0,,\n"
+    "ev_d,LAD,Batting,60,0,TRUE,512,A100,\n"
+    "ev_e,LAD,Pitching,90.25,0,true,4096,RTX_4000_Ada,2024-04-02T20:00:00\n"
+)
+
+COMBINED_CSV = (
+    "event_name,event_type,onprem_time_sec,onprem_exit_code,onprem_gpu,fps_category\n"
+    "ev_a,Batting,120.5,0,RTX_4000_Ada,300\n"
+    "ev_b,Pitching,59.9,0,RTX_4000_Ada,600\n"
+    "ev_d,Batting,600,0,,600\n"
+    "ev_e,Pitching,75,2,L4,\n"
+    "ev_f,Batting,80,0,RTX_4000_Ada,450\n"
+)
+
+ENRICH_LEDGER_CSV = (
+    "event_name,session,fps,s3_path,notes\n"
+    "ev_a,2024_S1,600,s3://bucket/ev_a,x\n"
+    "ev_d,2024_S2,,s3://bucket/ev_d,y\n"
+    "ev_d,2024_S3,300,s3://bucket/ev_d2,z\n"
+    "ev_e,,,,\n"
+)
+
+
+def _dictreader_events(
+    csv_path: str,
+    min_processing_time: float,
+    require_valid_c3d: bool,
+    ledger_path: Optional[str],
+) -> List[Event]:
+    """The row-by-row csv.DictReader loader the pandas parser replaced."""
+    ledger: Dict[str, dict] = {}
+    if ledger_path is not None:
+        with open(ledger_path, newline="") as f:
+            ledger = {row["event_name"]: row for row in csv.DictReader(f)}
+
+    events: List[Event] = []
+    with open(csv_path, newline="") as f:
+        reader = csv.DictReader(f)
+        is_combined = "onprem_time_sec" in (reader.fieldnames or [])
+        for row in reader:
+            if is_combined:
+                processing_time = float(row["onprem_time_sec"])
+                c3d_valid = True
+                c3d_size_bytes = 0
+                exit_code = int(row.get("onprem_exit_code", 0))
+                gpu_model = row.get("onprem_gpu", "RTX_4000_Ada")
+                venue = _venue_from_event_name(row["event_name"])
+                fps_val = _fps_from_category(row.get("fps_category", ""))
+            else:
+                processing_time = float(row["processing_time_sec"])
+                c3d_valid = row["c3d_valid"].lower() == "true"
+                c3d_size_bytes = int(row["c3d_size_bytes"])
+                exit_code = int(row["exit_code"])
+                gpu_model = row.get("gpu_model", "RTX_4000_Ada")
+                venue = row["venue"]
+                fps_val = None
+
+            if processing_time < min_processing_time:
+                continue
+            if require_valid_c3d and not c3d_valid:
+                continue
+
+            meta = ledger.get(row["event_name"], {})
+            events.append(Event(
+                event_name=row["event_name"],
+                venue=venue,
+                venue_type=row.get("venue_type", "mlb"),
+                event_type=row["event_type"],
+                gpu_model=gpu_model,
+                processing_time_sec=processing_time,
+                exit_code=exit_code,
+                c3d_valid=c3d_valid,
+                c3d_size_bytes=c3d_size_bytes,
+                timestamp=row.get("timestamp"),
+                session=meta.get("session"),
+                fps=float(meta["fps"]) if meta.get("fps") else fps_val,
+                s3_path=meta.get("s3_path"),
+            ))
+    return events
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> Dict[str, str]:
+    paths = {}
+    for name, text in (
+        ("legacy", LEGACY_CSV), ("combined", COMBINED_CSV), ("ledger", ENRICH_LEDGER_CSV),
+    ):
+        path = tmp_path / f"{name}.csv"
+        path.write_text(text)
+        paths[name] = str(path)
+    return paths
+
+
+class TestIterOnpremEvents:
+    """The pandas parser must match the old csv.DictReader loader record for record."""
+
+    @pytest.mark.parametrize("fmt", ["legacy", "combined"])
+    @pytest.mark.parametrize("min_processing_time", [0.0, 60.0, 100.0])
+    @pytest.mark.parametrize("require_valid_c3d", [True, False])
+    @pytest.mark.parametrize("enrich", [True, False])
+    def test_matches_dictreader_loader(
+        self,
+        files: Dict[str, str],
+        fmt: str,
+        min_processing_time: float,
+        require_valid_c3d: bool,
+        enrich: bool,
+    ) -> None:
+        ledger = files["ledger"] if enrich else None
+        expected = _dictreader_events(files[fmt], min_processing_time, require_valid_c3d, ledger)
+        result = list(_iter_onprem_events(files[fmt], min_processing_time, require_valid_c3d, ledger))
+
+        assert result == expected
+        for got, want in zip(result, expected):
+            # == on floats would accept 1 vs 1.0; the types must match too
+            assert type(got.processing_time_sec) is type(want.processing_time_sec)
+            assert type(got.exit_code) is type(want.exit_code)
+            assert type(got.fps) is type(want.fps)
+
+    def test_filters_applied(self, files: Dict[str, str]) -> None:
+        names = [e.event_name for e in _iter_onprem_events(files["legacy"], 60.0, True, None)]
+        # ev_b is under the time floor, ev_c has an invalid c3d
+        assert names == ["ev_a", "ev_d", "ev_e"]
+
+    def test_ledger_enrichment(self, files: Dict[str, str]) -> None:
+        events = {e.event_name: e for e in _iter_onprem_events(files["combined"], 0.0, True, files["ledger"])}
+
+        assert (events["ev_a"].session, events["ev_a"].fps) == ("2024_S1", 600.0)
+        # Last duplicate ledger row wins
+        assert events["ev_d"].s3_path == "s3://bucket/ev_d2"
+        # Blank ledger fps falls back to fps_category; blank fields stay ""
+        assert (events["ev_e"].session, events["ev_e"].fps) == ("", None)
+        # Unmatched events get no ledger metadata
+        assert (events["ev_b"].session, events["ev_b"].fps) == (None, 600.0)
+        assert events["ev_f"].fps is None
+
+    @pytest.mark.parametrize("column, value", [
+        ("processing_time_sec", ""),
+        ("processing_time_sec", "fast"),
+        ("exit_code", ""),
+        ("c3d_size_bytes", "big"),
+    ])
+    def test_bad_numeric_field_raises(self, tmp_path: Path, column: str, value: str) -> None:
+        rows = list(csv.DictReader(LEGACY_CSV.splitlines()))
+        rows[0][column] = value
+        path = tmp_path / "bad.csv"
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+        with pytest.raises(ValueError):
+            _dictreader_events(str(path), 60.0, True, None)
+        with pytest.raises(ValueError):
+            list(_iter_onprem_events(str(path), 60.0, True, None))
+
+    def test_bad_ledger_fps_raises(self, files: Dict[str, str], tmp_path: Path) -> None:
+        ledger = tmp_path / "bad_ledger.csv"
+        ledger.write_text(ENRICH_LEDGER_CSV.replace(",600,s3", ",n/a,s3"))
+
+        with pytest.raises(ValueError):
+            _dictreader_events(files["combined"], 0.0, True, str(ledger))
+        with pytest.raises(ValueError):
+            list(_iter_onprem_events(files["combined"], 0.0, True, str(ledger)))
+
+        # ev_a (120.5s) is dropped by the time floor before its ledger fps is read
+        expected = _dictreader_events(files["combined"], 200.0, True, str(ledger))
+        assert list(_iter_onprem_events(files["combined"], 200.0, True, str(ledger))) == expected
+        assert [e.event_name for e in expected] == ["ev_d"]
+
+
+class TestPublicLoaders:
+    """iter_onprem_results and load_onprem_results_df agree with load_onprem_results."""
+
+    @pytest.mark.parametrize("fmt", ["legacy", "combined"])
+    @pytest.mark.parametrize("enrich", [True, False])
+    def test_iter_matches_list(self, files: Dict[str, str], fmt: str, enrich: bool) -> None:
+        kwargs = dict(min_processing_time=60.0, enrich=enrich, ledger_path=files["ledger"])
+        expected = load_onprem_results(files[fmt], **kwargs)
+
+        assert expected
+        assert list(iter_onprem_results(files[fmt], **kwargs)) == expected
+
+    @pytest.mark.parametrize("fmt", ["legacy", "combined"])
+    @pytest.mark.parametrize("enrich", [True, False])
+    def test_df_matches_list(self, files: Dict[str, str], fmt: str, enrich: bool) -> None:
+        kwargs = dict(min_processing_time=60.0, enrich=enrich, ledger_path=files["ledger"])
+        expected = load_onprem_results(files[fmt], **kwargs)
+        df = load_onprem_results_df(files[fmt], **kwargs)
+
+        assert list(df.columns) == [f.name for f in dataclasses.fields(Event)]
+        assert len(df) == len(expected)
+        for row, event in zip(df.itertuples(index=False), expected):
+            record = row._asdict()
+            # Missing values come back as NaN (fps always, strings on pandas 3)
+            for name, value in record.items():
+                if getattr(event, name) is None and value is not None:
+                    assert pd.isna(value)
+                    record[name] = None
+            assert Event(**record) == event
@@ -2,19 +2,23 @@
 
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add app directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
 
+import numpy as np
 import pytest
 
 from data.schemas import CloudCostModel, Event, InstanceType, ParetoPoint, SiteProfile
 from optimization.pareto import (
     compute_pareto_frontier,
     compute_pareto_frontier_multi,
+    compute_pareto_set,
     find_optimal_configuration,
     generate_multi_instance_sweep,
     is_dominated,
+    sweep_baseline,
 )
 
 
@@ -84,6 +88,18 @@ class TestComputeParetoFrontier:
         assert result[2].is_pareto_optimal is True   # G5_C10
         assert result[3].is_pareto_optimal is False  # G5_C3 (dominated)
 
+    def test_ties_and_duplicates(self) -> None:
+        points = [
+            ("A", 50.0, 7000.0),
+            ("B", 50.0, 7000.0),    # exact duplicate of A, neither dominates
+            ("C", 50.0, 8000.0),    # same cost, slower
+            ("D", 80.0, 7000.0),    # same time, pricier
+            ("E", 0.0, 10000.0),
+        ]
+        result = compute_pareto_frontier(points)
+
+        assert [p.is_pareto_optimal for p in result] == [True, True, False, False, True]
+
 
 class TestFindOptimalConfiguration:
     """Tests for find_optimal_configuration function."""
@@ -118,6 +134,26 @@ class TestFindOptimalConfiguration:
         # Middle point should score best with balanced weights
         assert result is not None
 
+    def test_pareto_set_matches_point_list(self) -> None:
+        sweep = [("G5_C0", 0.0, 10000.0, 0), ("G5_C5", 50.0, 7000.0, 5),
+                 ("G5_C7", 80.0, 7000.0, 7), ("G5_C10", 100.0, 5000.0, 10)]
+        pareto_set = compute_pareto_set(sweep)
+        for weight in (0.0, 0.5, 1.0):
+            from_set = find_optimal_configuration(pareto_set, cost_weight=weight)
+            from_list = find_optimal_configuration(pareto_set.points, cost_weight=weight)
+            assert from_set == from_list
+        costs, times = pareto_set.frontier_line()
+        assert costs.tolist() == [0.0, 50.0, 100.0]
+        assert times.tolist() == [10000.0, 7000.0, 5000.0]
+
+    def test_pareto_set_identity_eq_and_hash(self) -> None:
+        sweep = [("G5_C0", 0.0, 10000.0, 0), ("G5_C5", 50.0, 7000.0, 5)]
+        first, second = compute_pareto_set(sweep), compute_pareto_set(sweep)
+        # Multi-element arrays must not reach a generated __eq__/__hash__
+        assert first == first
+        assert first != second
+        assert len({first, second}) == 2
+
 
 # --- New tests for multi-instance features ---
 
@@ -177,6 +213,59 @@ class TestCloudCostModelRatio:
         assert t1 < t2  # Shorter on-prem -> shorter cloud
 
 
+class TestCloudCostModelRate:
+    """effective_cost_per_hour follows the current pricing fields."""
+
+    def test_model_copy_flips_spot(self) -> None:
+        model = CloudCostModel(cost_per_hour=0.526, spot_cost_per_hour=0.16)
+        spot = model.model_copy(update={"use_spot": True})
+
+        assert model.effective_cost_per_hour == 0.526
+        assert spot.effective_cost_per_hour == 0.16
+        assert spot.model_copy(update={"use_spot": False}).effective_cost_per_hour == 0.526
+        assert spot.event_cloud_cost_for(3600.0) < model.event_cloud_cost_for(3600.0)
+
+    def test_spot_without_spot_rate_uses_on_demand(self) -> None:
+        model = CloudCostModel(cost_per_hour=0.526, spot_cost_per_hour=None, use_spot=True)
+        assert model.effective_cost_per_hour == 0.526
+
+    def test_vectorize_resolves_rate_once_per_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls = []
+        resolve = CloudCostModel.effective_cost_per_hour.fget
+
+        def counting(self: CloudCostModel) -> float:
+            calls.append(1)
+            return resolve(self)
+
+        monkeypatch.setattr(CloudCostModel, "effective_cost_per_hour", property(counting))
+        model = CloudCostModel(ratio=2.18, cost_per_hour=0.526, spot_cost_per_hour=0.16)
+        spot = model.model_copy(update={"use_spot": True})
+
+        _, costs = model.vectorize(np.full(500, 3600.0))
+        _, spot_costs = spot.vectorize(np.full(500, 3600.0))
+
+        assert len(calls) == 2
+        assert costs[0] == pytest.approx(2.18 * 0.526 + model.data_transfer_cost_per_event)
+        assert spot_costs[0] == pytest.approx(2.18 * 0.16 + spot.data_transfer_cost_per_event)
+
+
+class TestCloudCostModelVectorize:
+    """vectorize must match the per-event methods element by element."""
+
+    @pytest.mark.parametrize("ratio", [None, 2.18])
+    @pytest.mark.parametrize("use_spot", [False, True])
+    def test_matches_per_event_methods(self, ratio: Optional[float], use_spot: bool) -> None:
+        model = CloudCostModel(
+            ratio=ratio, use_spot=use_spot, cost_per_hour=0.526, spot_cost_per_hour=0.16,
+            cloud_time_per_event_sec=1378.0, data_transfer_sec_per_event=12.0,
+        )
+        on_prem = [0.0, 61.5, 300.0, 1234.5, 7200.0]
+        times, costs = model.vectorize(on_prem)
+
+        assert times.tolist() == pytest.approx([model.event_cloud_time_for(t) for t in on_prem])
+        assert costs.tolist() == pytest.approx([model.event_cloud_cost_for(t) for t in on_prem])
+
+
 class TestMultiInstanceSweep:
     """Tests for generate_multi_instance_sweep."""
 
@@ -237,6 +326,20 @@ class TestMultiInstanceSweep:
         # First point (C=0) should have zero cloud cost
         assert points[0][1] == 0.0
 
+    def test_sweep_baseline(self) -> None:
+        events = _make_events(3)
+        site = SiteProfile(name="Test", venue_code="TST", available_gpus=2, tier="gpu_poor")
+        raw_points = generate_multi_instance_sweep(
+            events, site, _make_instance_types(), ["spot"], max_cloud_containers=2,
+        )
+        points = compute_pareto_frontier_multi(raw_points)
+
+        baseline = sweep_baseline(points)
+        assert baseline is points[0]
+        assert baseline == next(p for p in points if p.cost == 0)
+        assert sweep_baseline(points[1:]) is None
+        assert sweep_baseline([]) is None
+
 
 class TestComputeParetoFrontierMulti:
     """Tests for compute_pareto_frontier_multi."""
@@ -286,6 +389,45 @@ class TestComputeParetoFrontierMulti:
         assert frontier < total  # Some must be dominated
 
 
+class TestParetoPointFromArrays:
+    """from_arrays must build the same points as field-by-field construction."""
+
+    def test_round_trip_numpy_columns(self) -> None:
+        expected = [
+            ParetoPoint(config_id="T4_spot_C0", cost=0.0, time=7200.0, cloud_containers=0,
+                        is_pareto_optimal=True, instance_type="g4dn.xlarge", pricing_tier="spot"),
+            ParetoPoint(config_id="T4_spot_C4", cost=12.5, time=3600.5, cloud_containers=4,
+                        is_pareto_optimal=False, instance_type="g4dn.xlarge", pricing_tier="spot"),
+            ParetoPoint(config_id="L4_ondemand_C8", cost=40.25, time=1800.0, cloud_containers=8,
+                        is_pareto_optimal=True, instance_type="g6.xlarge", pricing_tier="ondemand"),
+        ]
+        points = ParetoPoint.from_arrays(
+            np.array([p.config_id for p in expected], dtype=object),
+            np.array([p.cost for p in expected]),
+            np.array([p.time for p in expected]),
+            np.array([p.is_pareto_optimal for p in expected]),
+            cloud_containers=np.array([p.cloud_containers for p in expected]),
+            instance_types=[p.instance_type for p in expected],
+            pricing_tiers=[p.pricing_tier for p in expected],
+        )
+
+        assert points == expected
+        # NumPy scalars must not leak into the points
+        for p in points:
+            assert type(p.cost) is float and type(p.time) is float
+            assert type(p.cloud_containers) is int and type(p.is_pareto_optimal) is bool
+
+    def test_omitted_columns_take_defaults(self) -> None:
+        points = ParetoPoint.from_arrays(["G5_C0", "G5_C1"], [0.0, 1.5], [100.0, 80.0], [True, True])
+        assert points == [
+            ParetoPoint(config_id="G5_C0", cost=0.0, time=100.0, is_pareto_optimal=True),
+            ParetoPoint(config_id="G5_C1", cost=1.5, time=80.0, is_pareto_optimal=True),
+        ]
+
+    def test_empty(self) -> None:
+        assert ParetoPoint.from_arrays([], np.array([]), np.array([]), np.array([], dtype=bool)) == []
+
+
 class TestInstanceType:
     """Tests for InstanceType model."""
 
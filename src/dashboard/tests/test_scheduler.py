@@ -0,0 +1,143 @@
+"""Tests for the LPT scheduler and its batched sweep path."""
+
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+# Add app directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+
+import pytest
+
+from data.schemas import CloudCostModel, Event, InstanceType, SiteProfile
+from optimization.pareto import generate_cloud_sweep, generate_multi_instance_sweep
+from simulation.scheduler import execute_plan, prepare_plan, schedule_lpt, schedule_lpt_sweep
+
+
+C_VALUES = [0, 1, 2, 3, 7, 20]
+
+
+def _make_events() -> List[Event]:
+    """Uneven processing times with ties, so LPT order and tie-breaks matter."""
+    times = [3600.0, 61.0, 1200.5, 1200.5, 845.25, 300.0, 2400.0, 61.0, 999.9, 1800.0, 450.0, 450.0]
+    return [
+        Event(
+            event_name=f"ev_{i}",
+            venue="TST",
+            event_type="Pitching" if i % 2 == 0 else "Batting",
+            processing_time_sec=t,
+        )
+        for i, t in enumerate(times)
+    ]
+
+
+def _site(gpus: int) -> SiteProfile:
+    return SiteProfile(name=f"G{gpus}", venue_code="TST", available_gpus=gpus, tier="gpu_moderate")
+
+
+def _cloud_model(ratio: Optional[float]) -> CloudCostModel:
+    return CloudCostModel(
+        ratio=ratio, cost_per_hour=0.526, container_startup_sec=30.0, data_transfer_sec_per_event=5.0,
+    )
+
+
+class TestExecutePlan:
+    """execute_plan and schedule_lpt_sweep must reproduce schedule_lpt exactly."""
+
+    @pytest.mark.parametrize("gpus", [0, 1, 4])
+    @pytest.mark.parametrize("ratio", [None, 2.18])
+    def test_matches_schedule_lpt(self, gpus: int, ratio: Optional[float]) -> None:
+        events = _make_events()
+        site = _site(gpus)
+        model = _cloud_model(ratio)
+        # A site with no GPUs cannot run C=0
+        c_values = [c for c in C_VALUES if gpus + c > 0]
+
+        expected = [schedule_lpt(events, site, c, model) for c in c_values]
+        for config_ids, costs, times in (
+            execute_plan(prepare_plan(events, site), c_values, model),
+            schedule_lpt_sweep(events, site, c_values, model),
+        ):
+            assert config_ids == [r.config_id for r in expected]
+            assert costs.tolist() == [r.cloud_cost for r in expected]
+            assert times.tolist() == [r.turnaround_time_sec for r in expected]
+
+    def test_plan_reused_across_cost_models(self) -> None:
+        events = _make_events()
+        site = _site(2)
+        plan = prepare_plan(events, site)
+
+        for ratio in (None, 1.278, 2.18):
+            model = _cloud_model(ratio)
+            _, costs, times = execute_plan(plan, C_VALUES, model)
+            assert costs.tolist() == [schedule_lpt(events, site, c, model).cloud_cost for c in C_VALUES]
+            assert times.tolist() == [
+                schedule_lpt(events, site, c, model).turnaround_time_sec for c in C_VALUES
+            ]
+
+    def test_no_processors_raises(self) -> None:
+        events = _make_events()
+        site = _site(0)
+        model = _cloud_model(None)
+
+        with pytest.raises(ValueError):
+            schedule_lpt(events, site, 0, model)
+        with pytest.raises(ValueError):
+            execute_plan(prepare_plan(events, site), [0], model)
+        with pytest.raises(ValueError):
+            schedule_lpt_sweep(events, site, [2, 0], model)
+
+
+class TestSweepGenerators:
+    """The sweep generators must match the old per-config schedule_lpt loops."""
+
+    @pytest.mark.parametrize("gpus", [1, 4])
+    @pytest.mark.parametrize("ratio", [None, 2.18])
+    @pytest.mark.parametrize("step", [1, 3])
+    def test_cloud_sweep(self, gpus: int, ratio: Optional[float], step: int) -> None:
+        events = _make_events()
+        site = _site(gpus)
+        model = _cloud_model(ratio)
+
+        expected = []
+        for c in range(0, 10 + 1, step):
+            result = schedule_lpt(events, site, c, model)
+            expected.append((result.config_id, result.cloud_cost, result.turnaround_time_sec, c))
+
+        assert generate_cloud_sweep(events, site, model, 10, step) == expected
+
+    def test_cloud_sweep_zero_step_raises(self) -> None:
+        with pytest.raises(ValueError):
+            generate_cloud_sweep(_make_events(), _site(1), _cloud_model(None), 10, 0)
+
+    @pytest.mark.parametrize("gpus", [1, 4])
+    @pytest.mark.parametrize("step", [1, 3])
+    def test_multi_instance_sweep(self, gpus: int, step: int) -> None:
+        events = _make_events()
+        site = _site(gpus)
+        instances = [
+            InstanceType(name="g4dn.xlarge", gpu="Tesla T4", rate_ondemand=0.526, rate_spot=0.21,
+                         rate_1yr_ri=0.33, rate_3yr_ri=0.21, ratio=2.18),
+            InstanceType(name="p3.2xlarge", gpu="Tesla V100", rate_ondemand=3.06, rate_spot=0.92,
+                         rate_1yr_ri=None, rate_3yr_ri=None, ratio=0.9),
+        ]
+        pricing_modes = ["ondemand", "spot", "1yr_ri", "3yr_ri"]
+
+        expected = []
+        for instance in instances:
+            for pricing in pricing_modes:
+                if pricing not in instance.available_pricing():
+                    continue
+                model = CloudCostModel.from_instance(instance, pricing)
+                for c in range(0, 10 + 1, step):
+                    result = schedule_lpt(events, site, c, model)
+                    expected.append((
+                        f"{instance.gpu}_{pricing}_C{c}",
+                        result.cloud_cost,
+                        result.turnaround_time_sec,
+                        instance.name,
+                        pricing,
+                        c,
+                    ))
+
+        assert generate_multi_instance_sweep(events, site, instances, pricing_modes, 10, step) == expected